@@ -5,11 +5,16 @@ from dataclasses import dataclass
 
 @dataclass
 class LogPattern:
-    """Represents a log pattern with its regex and field names."""
+    """Represents a log pattern with its regex and field names.
+
+    required_literal, when set, is a substring every matching line must
+    contain, so callers can skip the regex for lines that lack it.
+    """
 
     pattern: re.Pattern
     field_names: List[str]
     name: str
+    required_literal: str = None
 
 
 patterns = {
@@ -20,6 +25,7 @@ patterns = {
             ),
             field_names=["timestamp", "level", "logger", "message"],
             name="bracketed_format",
+            required_literal="[",
         ),
         LogPattern(
             pattern=re.compile(
@@ -39,6 +45,7 @@ patterns = {
             pattern=re.compile(r"^\[([^\]]+)\]\s+(\w+)\s+in\s+([^:]+):\s*(.*)$"),
             field_names=["timestamp", "level", "logger", "message"],
             name="bracket_in_format",
+            required_literal="[",
         ),
         LogPattern(
             pattern=re.compile(
@@ -60,6 +67,7 @@ patterns = {
             ),
             field_names=["timestamp", "level", "module", "message"],
             name="bracketed_format",
+            required_literal="[",
         ),
         LogPattern(
             pattern=re.compile(
@@ -86,27 +94,34 @@ patterns = {
     ],
     "KeyValueDetector": [
         LogPattern(
-            pattern=re.compile(r"(\w+)=([^\s,;]+)"), field_names=[], name="key=value"
+            pattern=re.compile(r"(\w+)=([^\s,;]+)"),
+            field_names=[],
+            name="key=value",
+            required_literal="=",
         ),
         LogPattern(
             pattern=re.compile(r"(\w+):\s*([^\s,;]+)"),
             field_names=[],
             name="key: value",
+            required_literal=":",
         ),
         LogPattern(
             pattern=re.compile(r'(\w+)\s*=\s*"([^"]*)"'),
             field_names=[],
             name='key="value"',
+            required_literal='"',
         ),
         LogPattern(
             pattern=re.compile(r"(\w+)=\'([^\']*)\'"),
             field_names=[],
             name="key='value'",
+            required_literal="='",
         ),
         LogPattern(
             pattern=re.compile(r"(\w+)\s*:\s*\"([^\"]*)\""),
             field_names=[],
             name='key: "value"',
+            required_literal='"',
         ),
     ],
     "SyslogDetector": [
@@ -120,6 +135,7 @@ patterns = {
             ),
             field_names=["priority", "timestamp", "hostname", "tag", "message"],
             name="RFC3164",
+            required_literal="<",
         ),
         LogPattern(
             pattern=re.compile(
@@ -145,6 +161,7 @@ patterns = {
                 "message",
             ],
             name="RFC5424",
+            required_literal="<",
         ),
     ],
     "ApacheDetector": [
@@ -162,6 +179,7 @@ patterns = {
                 "bytes_sent",
             ],
             name="common",
+            required_literal='"',
         ),
         LogPattern(
             pattern=re.compile(
@@ -179,6 +197,7 @@ patterns = {
                 "user_agent",
             ],
             name="combined",
+            required_literal='"',
         ),
     ],
     "ApacheDetector_EXTENDED": [
@@ -197,6 +216,7 @@ patterns = {
                 "bytes_sent",
             ],
             name="with_virtual_host",
+            required_literal='"',
         ),
         LogPattern(
             pattern=re.compile(
@@ -213,6 +233,7 @@ patterns = {
                 "response_time",
             ],
             name="with_response_time",
+            required_literal='"',
         ),
         LogPattern(
             pattern=re.compile(
@@ -224,6 +245,7 @@ patterns = {
                 "message",
             ],
             name="mod_jk",
+            required_literal="[",
         ),
     ],
     "NginxDetector": [
@@ -243,6 +265,7 @@ patterns = {
                 "http_user_agent",
             ],
             name="access",
+            required_literal='"',
         ),
         LogPattern(
             pattern=re.compile(
@@ -256,6 +279,7 @@ patterns = {
                 "message",
             ],
             name="error",
+            required_literal="#",
         ),
     ],
     "NginxDetector_ACCESS_ALT": [
@@ -276,6 +300,7 @@ patterns = {
                 "request_time",
             ],
             name="with_request_time",
+            required_literal='"',
         ),
         LogPattern(
             pattern=re.compile(
@@ -289,6 +314,7 @@ patterns = {
                 "bytes_sent",
             ],
             name="simplified_format",
+            required_literal='"',
         ),
     ],
     "NginxDetector_ERROR_ALT": [
@@ -305,6 +331,7 @@ patterns = {
                 "message",
             ],
             name="with_connection",
+            required_literal="#",
         ),
         LogPattern(
             pattern=re.compile(
@@ -316,6 +343,7 @@ patterns = {
                 "message",
             ],
             name="simplified_error_format",
+            required_literal="[",
         ),
     ],
     "GenericWebLogDetector": [
@@ -331,6 +359,7 @@ patterns = {
                 "bytes_sent",
             ],
             name="ip_dash_dash_timestamp_request",
+            required_literal='"',
         ),
         LogPattern(
             pattern=re.compile(r'^(\S+)\s+\[([^\]]+)\]\s+"([^"]*?)"\s+(\d+)\s+(\d+|-)'),
@@ -342,6 +371,7 @@ patterns = {
                 "bytes_sent",
             ],
             name="ip_timestamp_request",
+            required_literal='"',
         ),
         LogPattern(
             pattern=re.compile(r'^\[([^\]]+)\]\s+(\S+)\s+"([^"]*?)"\s+(\d+)\s+(\d+|-)'),
@@ -353,6 +383,7 @@ patterns = {
                 "bytes_sent",
             ],
             name="timestamp_ip_request",
+            required_literal='"',
         ),
     ],
 }
@@ -3,6 +3,10 @@ from dataclasses import dataclass, field
 
 
 class LogFormat(Enum):
+    # Members are singletons compared by identity, so the C-level identity
+    # hash is valid and much cheaper than Enum's name-based __hash__.
+    __hash__ = object.__hash__
+
     JSON = "json"
     SYSLOG = "syslog"
     APACHE_COMMON = "apache_common"
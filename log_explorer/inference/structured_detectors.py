@@ -5,7 +5,7 @@ from io import StringIO
 
 from .base_detector import BaseFormatDetector
 from .log_core import LogFormat, FormatDetectionResult
-from .utils import SchemaManager
+from .utils import SchemaManager, load_json
 from .line_patterns import patterns
 
 import logging
@@ -26,7 +26,7 @@ class JSONDetector(BaseFormatDetector):
 
         for line in processed_lines:
             try:
-                data = json.loads(line)
+                data = load_json(line)
                 json_count += 1
                 samples.append(line)
                 self._extract_json_schema(data, schema)
@@ -69,6 +69,11 @@ class CSVDetector(BaseFormatDetector):
         if not processed_lines:
             return FormatDetectionResult(LogFormat.CSV, 0.0, {})
 
+        # _is_probably_csv needs the delimiter on enough lines; if no
+        # candidate delimiter gets there, skip sniffing altogether
+        if not self._has_common_delimiter(processed_lines):
+            return FormatDetectionResult(LogFormat.CSV, 0.0, {})
+
         csv_text = "\n".join(processed_lines)
 
         try:
@@ -164,6 +169,13 @@ class CSVDetector(BaseFormatDetector):
         except Exception:
             return {"schema": {}, "samples": [], "rows_processed": 0}
 
+    def _has_common_delimiter(self, lines):
+        required = max(3, len(lines) // 2)
+        return any(
+            sum(1 for line in lines if delimiter in line) >= required
+            for delimiter in self.supported_delimiters
+        )
+
     def _is_probably_csv(self, lines, dialect, schema_data):
         delimiter = dialect.delimiter
         delimiter_lines = sum(1 for line in lines if delimiter in line)
@@ -197,10 +209,16 @@ class LTSVDetector(BaseFormatDetector):
         samples = []
 
         for line in processed_lines:
-            if self._is_ltsv_format(line):
+            # Two valid pairs need a tab and two colons; most lines stop here
+            if "\t" not in line or line.count(":") < 2:
+                continue
+
+            pairs = self._split_ltsv_pairs(line)
+            if sum(1 for _, _, has_equals in pairs if not has_equals) >= 2:
                 matches += 1
                 samples.append(line)
-                self._extract_ltsv_schema(line, schema)
+                for key, value, _ in pairs:
+                    SchemaManager.update_field_info(schema, key, value)
 
         confidence = self.calculate_line_coverage(matches, len(processed_lines))
 
@@ -212,36 +230,18 @@ class LTSVDetector(BaseFormatDetector):
             metadata={"ltsv_matches": matches},
         )
 
-    def _is_ltsv_format(self, line):
-        if "\t" not in line:
-            return False
-
-        parts = line.split("\t")
-        valid_pairs = sum(1 for part in parts if self._is_valid_ltsv_pair(part.strip()))
-        return valid_pairs >= 2
-
-    def _is_valid_ltsv_pair(self, part):
-        if ":" not in part or "=" in part:
-            return False
-
-        try:
-            key, value = part.split(":", 1)
-            return bool(key.strip() and value.strip())
-        except ValueError:
-            return False
-
-    def _extract_ltsv_schema(self, line, schema):
-        parts = line.split("\t")
-        for part in parts:
-            part = part.strip()
-            if ":" in part:
-                try:
-                    key, value = part.split(":", 1)
-                    key, value = key.strip(), value.strip()
-                    if key and value:
-                        SchemaManager.update_field_info(schema, key, value)
-                except ValueError:
-                    continue
+    def _split_ltsv_pairs(self, line):
+        """Non-empty (key, value, has_equals) pairs; pairs containing "="
+        feed the schema but don't count as LTSV evidence.
+        """
+        pairs = []
+        for part in line.split("\t"):
+            key, separator, value = part.partition(":")
+            if separator:
+                key, value = key.strip(), value.strip()
+                if key and value:
+                    pairs.append((key, value, "=" in part))
+        return pairs
 
     def get_confidence_threshold(self):
         return 0.7
@@ -251,7 +251,11 @@ class KeyValueDetector(BaseFormatDetector):
 
     def __init__(self):
         super().__init__()
-        self.kv_patterns = [pattern.pattern for pattern in patterns["KeyValueDetector"]]
+        # (regex, required literal) pairs; the literal screens lines cheaply
+        self.kv_patterns = [
+            (pattern.pattern, getattr(pattern, "required_literal", None))
+            for pattern in patterns["KeyValueDetector"]
+        ]
 
     def detect(self, lines) -> FormatDetectionResult:
         processed_lines = self.preprocess_lines(lines)
@@ -281,7 +285,9 @@ class KeyValueDetector(BaseFormatDetector):
 
     def _extract_key_value_pairs(self, line):
         kv_pairs = {}
-        for pattern in self.kv_patterns:
+        for pattern, required_literal in self.kv_patterns:
+            if required_literal and required_literal not in line:
+                continue
             try:
                 matches = pattern.findall(line)
                 for key, value in matches:
@@ -79,6 +79,9 @@ class SyslogDetector(BaseFormatDetector):
 
     def _try_match_line(self, line):
         for pattern in self.patterns:
+            # Cheap substring screen before running the regex
+            if pattern.required_literal and pattern.required_literal not in line:
+                continue
             match = pattern.pattern.match(line)
             if match:
                 if pattern.name == "RFC3164":
@@ -191,7 +194,8 @@ class SystemdJournalDetector(BaseFormatDetector):
         current_entry = {}
 
         for line in lines:
-            if not line.strip():
+            # Lines arrive stripped; blank ones separate entries
+            if not line:
                 if current_entry:
                     entries.append(current_entry)
                     current_entry = {}
@@ -208,16 +212,9 @@ class SystemdJournalDetector(BaseFormatDetector):
         return entries
 
     def _parse_journal_field(self, line):
-        if "=" not in line:
-            return None
-
-        try:
-            key, value = line.split("=", 1)
-            if self._is_valid_journal_field(key):
-                return key, value
-        except ValueError:
-            pass
-
+        key, separator, value = line.partition("=")
+        if separator and self._is_valid_journal_field(key):
+            return key, value
         return None
 
     def _is_valid_journal_field(self, field_name):
@@ -1,5 +1,6 @@
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from .timestamp_patterns import TIMESTAMP_PATTERNS
 
@@ -7,10 +8,27 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+TIMEZONE_SUFFIX = re.compile(r"[+-]\d{2}:?\d{2}$")
+FOUR_DIGITS = re.compile(r"\d{4}")
+
+# Distinct (string, pattern) parses remembered; log streams repeat timestamps
+PARSE_CACHE_SIZE = 4096
+
 
 class TimestampDetector:
 
     TIMESTAMP_PATTERNS = TIMESTAMP_PATTERNS
+    # Compiled once, in the same priority order as TIMESTAMP_PATTERNS
+    COMPILED_PATTERNS = tuple(
+        re.compile(pattern_info["pattern"]) for pattern_info in TIMESTAMP_PATTERNS
+    )
+    # All patterns as one alternation: a single scan rules out text that
+    # contains no timestamp at all, which is most field values
+    ANY_TIMESTAMP = re.compile(
+        "|".join(
+            f"(?:{pattern_info['pattern']})" for pattern_info in TIMESTAMP_PATTERNS
+        )
+    )
 
     @classmethod
     def detect_timestamp(cls, text):
@@ -24,32 +42,32 @@ class TimestampDetector:
             List of tuples containing (datetime_object, format_string, confidence_score)
         """
         results = []
-        found_positions = set()  # Track positions to avoid overlapping matches
-
-        for pattern_info in cls.TIMESTAMP_PATTERNS:
-            pattern = pattern_info["pattern"]
-            format_str = pattern_info["format"]
+        if not cls.ANY_TIMESTAMP.search(text):
+            return results
+        found_spans = []  # Track spans to avoid overlapping matches
 
-            matches = re.finditer(pattern, text)
+        for index, pattern in enumerate(cls.COMPILED_PATTERNS):
+            format_str = cls.TIMESTAMP_PATTERNS[index]["format"]
 
-            for match in matches:
+            for match in pattern.finditer(text):
                 # Skip if this position overlaps with a higher-confidence match
                 start, end = match.span()
-                if any(pos >= start and pos < end for pos in found_positions):
+                if any(
+                    used_start < end and start < used_end
+                    for used_start, used_end in found_spans
+                ):
                     continue
 
                 timestamp_str = match.group(0)
 
                 try:
                     # Parse the timestamp
-                    parsed_dt, confidence = cls._parse_timestamp(
-                        timestamp_str, format_str, pattern_info
-                    )
+                    parsed_dt, confidence = cls._parse_cached(timestamp_str, index)
 
                     if parsed_dt:
                         results.append((parsed_dt, format_str, confidence))
                         # Mark this position range as used
-                        found_positions.update(range(start, end))
+                        found_spans.append((start, end))
 
                 except Exception as e:
                     logger.debug(
@@ -61,6 +79,16 @@ class TimestampDetector:
         results.sort(key=lambda x: (-x[2], x[0]))
         return results
 
+    @classmethod
+    @lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def _parse_cached(cls, timestamp_str, pattern_index):
+        """_parse_timestamp memoized per string and pattern.
+
+        Confidence only shifts with the clock over years, so reusing it is safe.
+        """
+        pattern_info = cls.TIMESTAMP_PATTERNS[pattern_index]
+        return cls._parse_timestamp(timestamp_str, pattern_info["format"], pattern_info)
+
     @classmethod
     def _parse_timestamp(cls, timestamp_str, format_str, pattern_info):
         """
@@ -168,8 +196,7 @@ class TimestampDetector:
                     pass
 
             # Parse without timezone as fallback
-            tz_pattern = r"[+-]\d{2}:?\d{2}$"
-            timestamp_no_tz = re.sub(tz_pattern, "", timestamp_str).strip()
+            timestamp_no_tz = TIMEZONE_SUFFIX.sub("", timestamp_str).strip()
             format_no_tz = format_str.replace(" %z", "").replace("%z", "")
 
             try:
@@ -294,7 +321,7 @@ class TimestampDetector:
             confidence -= 0.05
 
         # Format consistency check
-        if re.search(r"\d{4}", timestamp_str):  # Has 4-digit year
+        if FOUR_DIGITS.search(timestamp_str):  # Has 4-digit year
             confidence += 0.01
 
         # Clamp confidence to valid range
@@ -326,6 +353,30 @@ class TimestampDetector:
         results = cls.detect_timestamp(text)
         return [result for result in results if result[2] >= min_confidence]
 
+    @classmethod
+    def extract_all_timestamps_bulk(cls, texts, min_confidence=0.5):
+        """
+        Extract timestamps from many texts at once.
+
+        Log streams repeat the same timestamp text many times, so each
+        distinct text is detected once and its result shared.
+
+        Args:
+            texts: Iterable of input texts
+            min_confidence: Minimum confidence threshold (0.0 to 1.0)
+
+        Returns:
+            List with one extract_all_timestamps result per input text
+        """
+        seen = {}
+        results = []
+        for text in texts:
+            found = seen.get(text)
+            if found is None:
+                found = seen[text] = cls.extract_all_timestamps(text, min_confidence)
+            results.append(list(found))
+        return results
+
     @classmethod
     def get_confidence_explanation(cls, timestamp_str, confidence, pattern_name):
         """
@@ -1,5 +1,6 @@
 import gzip
 import bz2
+import json
 import lzma
 
 from .timestamp_detector import TimestampDetector
@@ -9,6 +10,27 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional faster JSON decoder
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def load_json(text):
+    """json.loads, through orjson when it is installed.
+
+    orjson is stricter (no NaN, no integers past 64 bits, no lone
+    surrogates), so text it rejects is retried with json, giving the
+    same results and errors either way.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(text)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
 
 class CompressionHandler:
 
@@ -59,6 +59,9 @@ class WebLogDetectorMixin:
         return min(base_confidence, 1.0)
 
     def _try_pattern_match(self, line, log_pattern, schema, sample_lines):
+        # Cheap substring screen before running the regex
+        if log_pattern.required_literal and log_pattern.required_literal not in line:
+            return False
         match = log_pattern.pattern.match(line)
         if match:
             if len(sample_lines) < 5:
@@ -161,6 +164,9 @@ class NginxDetector(BaseFormatDetector, WebLogDetectorMixin):
         self.error_pattern = patterns["NginxDetector"][1]
         self.access_alt_patterns = patterns["NginxDetector_ACCESS_ALT"]
         self.error_alt_patterns = patterns["NginxDetector_ERROR_ALT"]
+        # Tried in this order for every line
+        self.access_patterns = [self.access_pattern] + self.access_alt_patterns
+        self.error_patterns = [self.error_pattern] + self.error_alt_patterns
 
     def detect(self, lines):
         processed_lines = self.preprocess_lines(lines)
@@ -174,18 +180,10 @@ class NginxDetector(BaseFormatDetector, WebLogDetectorMixin):
 
         for line in processed_lines:
             try:
-                if self._try_patterns(
-                    line,
-                    [self.access_pattern] + self.access_alt_patterns,
-                    schema,
-                    sample_lines,
-                ):
+                if self._try_patterns(line, self.access_patterns, schema, sample_lines):
                     access_matches += 1
                 elif self._try_patterns(
-                    line,
-                    [self.error_pattern] + self.error_alt_patterns,
-                    schema,
-                    sample_lines,
+                    line, self.error_patterns, schema, sample_lines
                 ):
                     error_matches += 1
             except Exception as e:
@@ -6,10 +6,17 @@ from log_explorer.inference.timestamp_detector import TimestampDetector
 
 
 class BaseLogParserMixin:
+    LOG_LEVEL_PATTERN = re.compile(
+        r"\b(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL|FATAL)\b", re.IGNORECASE
+    )
+
     def _setup_timestamp_detector(self):
         self.timestamp_detector = TimestampDetector()
 
     def _try_pattern_match(self, line, pattern, entry):
+        if pattern.required_literal and pattern.required_literal not in line:
+            return False
+
         match = pattern.pattern.match(line)
         if not match:
             return False
@@ -44,10 +51,7 @@ class BaseLogParserMixin:
                 entry.fields["timestamp"] = line
 
     def _extract_log_level(self, line, entry):
-        level_pattern = re.compile(
-            r"\b(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL|FATAL)\b", re.IGNORECASE
-        )
-        level_match = level_pattern.search(line)
+        level_match = self.LOG_LEVEL_PATTERN.search(line)
         if level_match and "level" in self.schema:
             entry.fields["level"] = level_match.group().upper()
 
@@ -121,6 +125,9 @@ class BasicLogParser(BaseParser, BaseLogParserMixin):
         return entry
 
     def _try_pattern_with_validation(self, line, pattern, entry):
+        if pattern.required_literal and pattern.required_literal not in line:
+            return False
+
         match = pattern.pattern.match(line)
         if not match:
             return False
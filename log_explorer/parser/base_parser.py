@@ -1,9 +1,15 @@
+import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from log_explorer.inference.timestamp_detector import TimestampDetector
 
+# A literal character right after the "^" anchor, e.g. ^< or ^\[, that no
+# ?, * or {m,n} quantifier makes optional
+LEADING_LITERAL = re.compile(r"^\^(?:\\([^\w\s])|([^\\\[\](){}.*+?^$|\w\s]))(?![?*{])")
+
 
 @dataclass
 class ParsedLogEntry:
@@ -39,7 +45,12 @@ class ParseResult:
 class BaseParser(ABC):
     def __init__(self, detection_result):
         self.detection_result = detection_result
-        self.schema = detection_result.schema
+        # Interned keys make every entry's fields dict share the same name
+        # objects, so downstream per-field dict lookups match on identity
+        self.schema = {
+            sys.intern(field_name): field_info
+            for field_name, field_info in detection_result.schema.items()
+        }
         self.format_type = detection_result.format_type
         self.timestamp_detector = TimestampDetector()
         self._setup_parser()
@@ -53,26 +64,24 @@ class BaseParser(ABC):
         pass
 
     def parse_lines(self, lines):
+        """Parse an iterable of lines in a single pass; lines may keep newlines."""
         entries = []
-        successfully_parsed = 0
         malformed_lines = 0
 
         for i, line in enumerate(lines, 1):
-            if not line.strip():
+            line = line.strip()
+            if not line:
                 continue
 
-            entry = self.parse_line(line.strip(), i)
+            entry = self.parse_line(line, i)
             entries.append(entry)
-
             if entry.is_malformed:
                 malformed_lines += 1
-            else:
-                successfully_parsed += 1
 
         return ParseResult(
             entries=entries,
-            total_lines=len([l for l in lines if l.strip()]),
-            successfully_parsed=successfully_parsed,
+            total_lines=len(entries),
+            successfully_parsed=len(entries) - malformed_lines,
             malformed_lines=malformed_lines,
             parse_statistics=self._calculate_statistics(entries),
         )
@@ -159,6 +168,41 @@ class PatternBasedParser(BaseParser):
         self.patterns = []
         super().__init__(detection_result)
 
+    @property
+    def patterns(self):
+        return self._patterns
+
+    @patterns.setter
+    def patterns(self, value):
+        self._patterns = value
+        self._build_pattern_dispatch()
+
+    def _build_pattern_dispatch(self):
+        """Group patterns by the literal first character their regex requires.
+
+        Patterns without such an anchor, or with an alternation that may
+        start elsewhere, can match any line and are kept in every group;
+        original pattern order is preserved within each group.
+        """
+        leading = []
+        for pattern in self._patterns:
+            text = pattern.pattern.pattern
+            match = None if "|" in text else LEADING_LITERAL.match(text)
+            leading.append((match.group(1) or match.group(2)) if match else None)
+
+        self._unanchored_patterns = [
+            pattern for pattern, char in zip(self._patterns, leading) if char is None
+        ]
+        self._patterns_by_first_char = {
+            char: [
+                pattern
+                for pattern, lead in zip(self._patterns, leading)
+                if lead is None or lead == char
+            ]
+            for char in set(leading)
+            if char is not None
+        }
+
     def _setup_parser(self):
         pass
 
@@ -166,7 +210,10 @@ class PatternBasedParser(BaseParser):
         entry = ParsedLogEntry(fields={}, raw_line=line, line_number=line_number)
 
         try:
-            for pattern in self.patterns:
+            candidates = self._patterns_by_first_char.get(
+                line[:1], self._unanchored_patterns
+            )
+            for pattern in candidates:
                 if self._try_pattern(line, pattern, entry):
                     return entry
             self._fallback_parsing(line, entry)
@@ -176,6 +223,9 @@ class PatternBasedParser(BaseParser):
         return entry
 
     def _try_pattern(self, line, pattern, entry):
+        if pattern.required_literal and pattern.required_literal not in line:
+            return False
+
         match = pattern.pattern.match(line)
         if not match:
             return False
@@ -1,5 +1,6 @@
 from pathlib import Path
 import logging
+import lzma
 
 from .structured_parsers import JSONParser, DelimitedParser, KeyValueParser
 from .web_log_parsers import WebLogParser
@@ -19,7 +20,8 @@ logger = logging.getLogger(__name__)
 
 class LogParsingEngine:
     def __init__(self):
-        self.parser_classes = {
+        # Each entry builds a ready-to-use parser from a detection result
+        self._constructors = {
             LogFormat.JSON: JSONParser,
             LogFormat.CSV: DelimitedParser,
             LogFormat.LTSV: KeyValueParser,
@@ -31,36 +33,53 @@ class LogParsingEngine:
             LogFormat.NGINX_ERROR: WebLogParser,
             LogFormat.SYSLOG: SyslogParser,
             LogFormat.SYSTEMD_JOURNAL: SystemdJournalParser,
-            LogFormat.PYTHON_LOG: PatternBasedParser,
-            LogFormat.BASIC_LOG: PatternBasedParser,
+            LogFormat.PYTHON_LOG: self._pattern_parser("PythonLogDetector"),
+            LogFormat.BASIC_LOG: self._pattern_parser("BasicLogDetector"),
             LogFormat.CUSTOM_DELIMITED: DelimitedParser,
         }
+        # Only the most recent parser is kept: (cache_key, parser) or None
+        self._cached_parser = None
         logger.info(
-            f"Initialized parsing engine with {len(self.parser_classes)} parser types"
+            f"Initialized parsing engine with {len(self._constructors)} parser types"
         )
 
+    @staticmethod
+    def _pattern_parser(patterns_key):
+        def construct(detection_result):
+            parser = PatternBasedParser(detection_result)
+            parser.patterns = patterns[patterns_key]
+            return parser
+
+        return construct
+
     def create_parser(self, detection_result) -> BaseParser:
+        """Build a parser for the detection result, reusing the last one built.
+
+        Parsers copy what they need from the schema when constructed, so a
+        schema must not be changed in place after it has been used here;
+        pass a new detection result or call clear_parser_cache() instead.
+        """
         format_type = detection_result.format_type
 
-        if format_type == LogFormat.UNKNOWN:
-            raise ValueError("Cannot create parser for unknown format")
+        # The cached parser holds a reference to the schema, so its id stays unique
+        cache_key = (format_type, id(detection_result.schema))
+        if self._cached_parser is not None and self._cached_parser[0] == cache_key:
+            return self._cached_parser[1]
 
-        if format_type not in self.parser_classes:
+        constructor = self._constructors.get(format_type)
+        if constructor is None:
+            if format_type == LogFormat.UNKNOWN:
+                raise ValueError("Cannot create parser for unknown format")
             raise ValueError(f"No parser available for format: {format_type.value}")
 
-        parser_class = self.parser_classes[format_type]
-        parser = parser_class(detection_result)
-
-        # For pattern-based parsers, set up patterns after instantiation
-        if isinstance(parser, PatternBasedParser):
-            if format_type == LogFormat.PYTHON_LOG:
-                parser.patterns = patterns["PythonLogDetector"]
-            elif format_type == LogFormat.BASIC_LOG:
-                parser.patterns = patterns["BasicLogDetector"]
-
-        logger.info(f"Created {parser_class.__name__} for format {format_type.value}")
+        parser = constructor(detection_result)
+        self._cached_parser = (cache_key, parser)
+        logger.info(f"Created {type(parser).__name__} for format {format_type.value}")
         return parser
 
+    def clear_parser_cache(self):
+        self._cached_parser = None
+
     def parse_file(self, filepath, detection_result) -> ParseResult:
         filepath = Path(filepath)
 
@@ -69,16 +88,14 @@ class LogParsingEngine:
 
         parser = self.create_parser(detection_result)
 
-        lines = []
+        # Stream lines straight into the parser; parse_lines strips each one.
+        # Reading happens inside parse_lines, so only I/O errors are logged here
         try:
-            for line in CompressionHandler.open_file(filepath):
-                lines.append(line.rstrip("\n\r"))
-            logger.info(f"Read {len(lines)} lines from {filepath}")
-        except Exception as e:
+            result = parser.parse_lines(CompressionHandler.open_file(filepath))
+        except (OSError, EOFError, lzma.LZMAError) as e:
             logger.error(f"Error reading file {filepath}: {e}")
             raise
 
-        result = parser.parse_lines(lines)
         result.parse_statistics.update(
             {
                 "source_file": str(filepath),
@@ -88,8 +105,8 @@ class LogParsingEngine:
         )
 
         logger.info(
-            f"Parsed {result.successfully_parsed}/{result.total_lines} lines "
-            f"({result.success_rate:.1%} success rate)"
+            f"Parsed {result.successfully_parsed}/{result.total_lines} non-blank "
+            f"lines from {filepath} ({result.success_rate:.1%} success rate)"
         )
         return result
 
@@ -106,7 +123,7 @@ class LogParsingEngine:
         return parser.parse_line(line)
 
     def get_supported_formats(self):
-        return [fmt.value for fmt in self.parser_classes.keys()]
+        return [fmt.value for fmt in self._constructors.keys()]
 
     def validate_parsing_capability(self, detection_result):
         format_type = detection_result.format_type
@@ -124,7 +141,7 @@ class LogParsingEngine:
             validation_result["warnings"].append("Format is unknown - cannot parse")
             return validation_result
 
-        if format_type not in self.parser_classes:
+        if format_type not in self._constructors:
             validation_result["warnings"].append(
                 f"No parser available for format: {format_type.value}"
             )
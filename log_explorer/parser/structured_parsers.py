@@ -1,11 +1,11 @@
 import json
 import csv
 import re
-from io import StringIO
 
 from .base_parser import BaseParser, ParsedLogEntry
 from log_explorer.inference.line_patterns import patterns
 from log_explorer.inference.log_core import LogFormat
+from log_explorer.inference.utils import load_json
 
 
 class JSONParser(BaseParser):
@@ -17,7 +17,7 @@ class JSONParser(BaseParser):
         entry = ParsedLogEntry(fields={}, raw_line=line, line_number=line_number)
 
         try:
-            json_data = json.loads(line)
+            json_data = load_json(line)
             for field_name in self.schema.keys():
                 if field_name in json_data:
                     raw_value = json_data[field_name]
@@ -85,9 +85,9 @@ class DelimitedParser(BaseParser):
         entry = ParsedLogEntry(fields={}, raw_line=line, line_number=line_number)
 
         try:
-            if self.format_type == LogFormat.CSV:
-                csv_reader = csv.reader(StringIO(line), delimiter=self.delimiter)
-                parts = next(csv_reader)
+            # Without quotes csv.reader splits exactly like str.split
+            if self.format_type == LogFormat.CSV and '"' in line:
+                parts = next(csv.reader([line], delimiter=self.delimiter))
             else:
                 parts = line.split(self.delimiter)
 
@@ -133,14 +133,15 @@ class DelimitedParser(BaseParser):
 
 class KeyValueParser(BaseParser):
 
+    # LTSV: key1:value1<TAB>key2:value2
+    LTSV_PAIR_PATTERN = re.compile(r"([^:\t]+):([^\t]*)")
+
     def _setup_parser(self):
-        if self.format_type == LogFormat.LTSV:
-            # LTSV: key1:value1<TAB>key2:value2
-            self.kv_pattern = re.compile(r"([^:\t]+):([^\t]*)")
-        else:
+        if self.format_type != LogFormat.LTSV:
             # General key-value patterns
             self.kv_patterns = [
-                pattern.pattern for pattern in patterns["KeyValueDetector"]
+                (pattern.pattern, pattern.required_literal)
+                for pattern in patterns["KeyValueDetector"]
             ]
 
     def parse_line(self, line, line_number=None) -> ParsedLogEntry:
@@ -150,11 +151,13 @@ class KeyValueParser(BaseParser):
             found_fields = {}
 
             if self.format_type == LogFormat.LTSV:
-                matches = self.kv_pattern.findall(line)
+                matches = self.LTSV_PAIR_PATTERN.findall(line)
                 for key, value in matches:
                     found_fields[key.strip()] = value.strip()
             else:
-                for pattern in self.kv_patterns:
+                for pattern, required_literal in self.kv_patterns:
+                    if required_literal and required_literal not in line:
+                        continue
                     matches = pattern.findall(line)
                     for key, value in matches:
                         key, value = key.strip(), value.strip()
@@ -6,13 +6,17 @@ from log_explorer.inference.line_patterns import patterns
 
 
 class SyslogParser(PatternBasedParser):
+    SIMPLE_PATTERN = re.compile(
+        r"^(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+(.*)$"
+    )
+
     def _setup_parser(self):
         self.patterns = patterns["SyslogDetector"]
-        self.simple_pattern = re.compile(
-            r"^(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+(.*)$"
-        )
 
     def _try_pattern(self, line, pattern, entry):
+        if pattern.required_literal and pattern.required_literal not in line:
+            return False
+
         match = pattern.pattern.match(line)
         if not match:
             return False
@@ -85,7 +89,7 @@ class SyslogParser(PatternBasedParser):
             )
 
     def _fallback_parsing(self, line, entry):
-        match = self.simple_pattern.match(line)
+        match = self.SIMPLE_PATTERN.match(line)
         if match:
             timestamp_str, hostname, message = match.groups()
             field_mapping = {
@@ -116,11 +120,15 @@ class SyslogParser(PatternBasedParser):
 
 class SystemdJournalParser(BaseParser):
 
+    FIELD_PATTERN = re.compile(r"^([A-Z_][A-Z0-9_]*)=(.*)$")
+    FIELD_NAME_PATTERN = re.compile(r"^[A-Z_][A-Z0-9_]*$")
+    JOURNALCTL_PATTERN = re.compile(
+        r"^(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+([^:]+):\s*(.*)$"
+    )
+
     def _setup_parser(self):
-        self.field_pattern = re.compile(r"^([A-Z_][A-Z0-9_]*)=(.*)$")
-        self.journalctl_pattern = re.compile(
-            r"^(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+([^:]+):\s*(.*)$"
-        )
+        # Entries repeat the same few dozen field names; each is checked once
+        self._field_name_valid = {}
 
     def parse_lines(self, lines):
         entries = []
@@ -143,7 +151,7 @@ class SystemdJournalParser(BaseParser):
 
         return ParseResult(
             entries=entries,
-            total_lines=len([l for l in lines if l.strip()]),
+            total_lines=sum(len(entry_lines) for entry_lines in journal_entries),
             successfully_parsed=successfully_parsed,
             malformed_lines=malformed_lines,
             parse_statistics=self._calculate_statistics(entries),
@@ -154,12 +162,13 @@ class SystemdJournalParser(BaseParser):
         current_entry = []
 
         for line in lines:
-            if not line.strip():
+            line = line.strip()
+            if not line:
                 if current_entry:
                     entries.append(current_entry)
                     current_entry = []
             else:
-                current_entry.append(line.strip())
+                current_entry.append(line)
 
         if current_entry:
             entries.append(current_entry)
@@ -175,14 +184,13 @@ class SystemdJournalParser(BaseParser):
                 self._parse_journalctl_output(entry_lines[0], entry)
             else:
                 for line in entry_lines:
-                    if "=" not in line:
+                    field_name, separator, value = line.partition("=")
+                    if not separator:
                         entry.add_parse_error(f"Invalid journal field format: {line}")
                         continue
 
                     try:
-                        field_name, value = line.split("=", 1)
-
-                        if not re.match(r"^[A-Z_][A-Z0-9_]*$", field_name):
+                        if not self._is_valid_field_name(field_name):
                             entry.add_parse_error(
                                 f"Invalid journal field name: {field_name}"
                             )
@@ -214,12 +222,19 @@ class SystemdJournalParser(BaseParser):
 
         return entry
 
+    def _is_valid_field_name(self, field_name):
+        valid = self._field_name_valid.get(field_name)
+        if valid is None:
+            valid = bool(self.FIELD_NAME_PATTERN.match(field_name))
+            self._field_name_valid[field_name] = valid
+        return valid
+
     def parse_line(self, line, line_number=None) -> ParsedLogEntry:
         entry = ParsedLogEntry(fields={}, raw_line=line, line_number=line_number)
 
         try:
             if "=" in line:
-                match = self.field_pattern.match(line)
+                match = self.FIELD_PATTERN.match(line)
                 if not match:
                     entry.add_parse_error("Invalid journal field format")
                     return entry
@@ -248,7 +263,7 @@ class SystemdJournalParser(BaseParser):
         return entry
 
     def _parse_journalctl_output(self, line, entry):
-        match = self.journalctl_pattern.match(line)
+        match = self.JOURNALCTL_PATTERN.match(line)
         if not match:
             entry.add_parse_error("Line does not match journalctl output format")
             if "message" in self.schema:
@@ -1,29 +1,125 @@
-from datetime import datetime
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 from .base_parser import PatternBasedParser
 from log_explorer.inference.log_core import LogFormat
 from log_explorer.inference.line_patterns import patterns
 
+MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+# Apache/Nginx access: [25/Dec/2023:10:15:30 +0000]
+ACCESS_TIMESTAMP = re.compile(
+    r"^\[?(\d{2})/([A-Za-z]{3})/(\d{4}):(\d{2}):(\d{2}):(\d{2})"
+    r"(?:\s+([+-])(\d{2})(\d{2}))?\]?$"
+)
+# Nginx error: 2023/12/25 10:15:35
+ERROR_TIMESTAMP = re.compile(r"^(\d{4})/(\d{2})/(\d{2})\s+(\d{2}):(\d{2}):(\d{2})$")
+# Apache mod_jk: Sun Dec 04 04:47:44 2005
+CTIME_TIMESTAMP = re.compile(
+    r"^\[?[A-Za-z]{3}\s+([A-Za-z]{3})\s+(\d{2})\s+(\d{2}):(\d{2}):(\d{2})\s+(\d{4})\]?$"
+)
+
+
+@lru_cache(maxsize=None)
+def _utc_offset(sign, hours, minutes):
+    offset = timedelta(hours=int(hours), minutes=int(minutes))
+    return timezone(-offset if sign == "-" else offset)
+
+
+def _parse_access_timestamp(value):
+    match = ACCESS_TIMESTAMP.match(value)
+    if not match:
+        return None
+
+    day, month, year, hour, minute, second, sign, tz_hours, tz_minutes = match.groups()
+    tzinfo = _utc_offset(sign, tz_hours, tz_minutes) if sign else None
+    return datetime(
+        int(year),
+        MONTHS[month.title()],
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        tzinfo=tzinfo,
+    )
+
+
+def _parse_error_timestamp(value):
+    match = ERROR_TIMESTAMP.match(value)
+    if not match:
+        return None
+    return datetime(*map(int, match.groups()))
+
+
+def _parse_ctime_timestamp(value):
+    match = CTIME_TIMESTAMP.match(value)
+    if not match:
+        return None
+
+    month, day, hour, minute, second, year = match.groups()
+    return datetime(
+        int(year),
+        MONTHS[month.title()],
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+    )
+
 
 class WebLogParser(PatternBasedParser):
 
     def _setup_parser(self):
+        # Build new lists so the shared pattern registry is never mutated
         if self.format_type in [
             LogFormat.APACHE_COMMON,
             LogFormat.APACHE_COMBINED,
             LogFormat.APACHE_EXTENDED,
         ]:
-            self.patterns = patterns["ApacheDetector"]
+            web_patterns = list(patterns["ApacheDetector"])
             if self.format_type == LogFormat.APACHE_EXTENDED:
-                self.patterns.extend(patterns["ApacheDetector_EXTENDED"])
+                web_patterns.extend(patterns["ApacheDetector_EXTENDED"])
         elif self.format_type in [LogFormat.NGINX_ACCESS, LogFormat.NGINX_ERROR]:
-            self.patterns = patterns["NginxDetector"]
+            web_patterns = list(patterns["NginxDetector"])
             if self.format_type == LogFormat.NGINX_ACCESS:
-                self.patterns.extend(patterns["NginxDetector_ACCESS_ALT"])
+                web_patterns.extend(patterns["NginxDetector_ACCESS_ALT"])
             else:
-                self.patterns.extend(patterns["NginxDetector_ERROR_ALT"])
+                web_patterns.extend(patterns["NginxDetector_ERROR_ALT"])
         else:
-            self.patterns = patterns["GenericWebLogDetector"]
+            web_patterns = patterns["GenericWebLogDetector"]
+        self.patterns = web_patterns
+
+        self._has_method = "method" in self.schema
+        self._has_path = "path" in self.schema
+        self._has_protocol = "protocol" in self.schema
+
+        # Fast timestamp parsers, most likely first for this format
+        if self.format_type == LogFormat.NGINX_ERROR:
+            self.timestamp_parsers = (
+                _parse_error_timestamp,
+                _parse_access_timestamp,
+                _parse_ctime_timestamp,
+            )
+        else:
+            self.timestamp_parsers = (
+                _parse_access_timestamp,
+                _parse_ctime_timestamp,
+                _parse_error_timestamp,
+            )
 
     def _try_pattern(self, line, pattern, entry):
         if not super()._try_pattern(line, pattern, entry):
@@ -39,46 +135,46 @@ class WebLogParser(PatternBasedParser):
 
         return True
 
+    def _map_field_value(self, entry, field_name, value):
+        # Timestamps are parsed once in _parse_web_timestamp
+        if field_name == "timestamp" and field_name in self.schema:
+            entry.fields[field_name] = value
+        else:
+            super()._map_field_value(entry, field_name, value)
+
     def _parse_web_timestamp(self, entry):
         timestamp_str = entry.fields["timestamp"]
 
-        try:
-            if self.format_type in [LogFormat.NGINX_ERROR]:
-                # Nginx error: 2023/12/25 10:15:35
-                entry.timestamp = datetime.strptime(timestamp_str, "%Y/%m/%d %H:%M:%S")
-            elif "[" in timestamp_str:
-                # Apache/Nginx access: [25/Dec/2023:10:15:30 +0000]
-                clean_timestamp = timestamp_str.strip("[]").split()[0]
-                entry.timestamp = datetime.strptime(
-                    clean_timestamp, "%d/%b/%Y:%H:%M:%S"
-                )
-            else:
-                # Fallback to detector
-                detected = self.timestamp_detector.detect_timestamp(timestamp_str)
-                if detected:
-                    entry.timestamp = detected[0][0]
-                else:
-                    entry.add_parse_error(f"Failed to parse timestamp: {timestamp_str}")
-        except ValueError:
-            detected = self.timestamp_detector.detect_timestamp(timestamp_str)
-            if detected:
-                entry.timestamp = detected[0][0]
-            else:
-                entry.add_parse_error(f"Failed to parse timestamp: {timestamp_str}")
+        for parse in self.timestamp_parsers:
+            try:
+                parsed = parse(timestamp_str)
+            except (ValueError, KeyError):
+                break
+            if parsed:
+                entry.timestamp = parsed
+                return
+
+        # Fallback to detector
+        detected = self.timestamp_detector.detect_timestamp(timestamp_str)
+        if detected:
+            entry.timestamp = detected[0][0]
+        else:
+            entry.add_parse_error(f"Failed to parse timestamp: {timestamp_str}")
 
     def _parse_request_field(self, entry):
         request = entry.fields.get("request", "")
         if not request or request == "-":
             return
 
-        try:
-            parts = request.split()
-            if len(parts) >= 2:
-                if "method" in self.schema:
-                    entry.fields["method"] = parts[0]
-                if "path" in self.schema:
-                    entry.fields["path"] = parts[1]
-                if "protocol" in self.schema and len(parts) >= 3:
-                    entry.fields["protocol"] = parts[2]
-        except Exception:
-            pass
+        # "METHOD PATH PROTOCOL": same tokens as split(), but at most a fourth
+        # element holds the rest of the line instead of one per extra word
+        parts = request.split(None, 3)
+        if len(parts) < 2:
+            return
+
+        if self._has_method:
+            entry.fields["method"] = parts[0]
+        if self._has_path:
+            entry.fields["path"] = parts[1]
+        if self._has_protocol and len(parts) >= 3:
+            entry.fields["protocol"] = parts[2]
@@ -1,7 +1,35 @@
 import re
+import sys
+import time
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict
+from operator import ge, gt, le, lt
+
+try:
+    # Optional linear-time engine; immune to catastrophic backtracking
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# Most recent query results kept per indexed entry set
+RESULT_CACHE_SIZE = 128
+
+# Joins searchable text in the corpus; queries containing it never use the corpus
+CORPUS_SEPARATOR = "\x00"
+
+# Word characters; a query's tokens always fall inside the tokens of a match
+TOKEN = re.compile(r"\w+")
+
+NUMERIC_COMPARISONS = {"gt": gt, "lt": lt, "gte": ge, "lte": le}
+
+# Characters with special meaning in a regex; anything else matches itself
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]()|\\")
+
+# Ignoring case, these also match letters that don't lowercase to them
+# (dotless "ı", long "ſ"), so a lowercase literal check would miss those
+AMBIGUOUS_FOLDS = frozenset("is")
 
 
 @dataclass
@@ -10,6 +38,26 @@ class SearchFilter:
     value: str = None
     operator: str = "contains"  # contains, equals, regex, gt, lt, gte, lte
     case_sensitive: bool = False
+    _matcher: object = field(default=None, init=False, repr=False, compare=False)
+    _matcher_key: tuple = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Index keys are interned, so lookups can match on identity
+        if isinstance(self.field_name, str):
+            self.field_name = sys.intern(self.field_name)
+        self.get_matcher()
+
+    def get_matcher(self):
+        """Predicate over a field value, or None if nothing can match.
+
+        Field values passed in must already be lowercased unless the filter
+        is case sensitive. Rebuilt only if the filter has been modified.
+        """
+        key = (self.operator, self.value, self.case_sensitive)
+        if self._matcher_key != key:
+            self._matcher = _build_matcher(*key)
+            self._matcher_key = key
+        return self._matcher
 
 
 @dataclass
@@ -36,60 +84,221 @@ class SearchResult:
     search_time: float
     query: SearchQuery
     field_counts: dict = field(default_factory=dict)
+    ids: list = field(default_factory=list)  # Entry positions, aligned with entries
 
 
 class LogSearchEngine:
 
     def __init__(self):
         self.entries = []
-        self.field_index = defaultdict(list)
-        self.timestamp_index = []
+        self.columns = {}
+        self.value_index = {}
+        self.numeric_columns = {}
+        self._raw_lower = []
+        self._ts_sorted_ts = []
+        self._ts_sorted_ids = []
+        self._ts_rank = []
+        self._ts_in_entry_order = True
+        self.token_index = None
+        self._vocabulary = []
+        self._vocabulary_text = ""
+        self._vocabulary_starts = []
+        self.trigram_index = None
+        self._corpus = None
+        self._corpus_starts = []
+        self._result_cache = OrderedDict()
 
     def index_entries(self, entries):
         self.entries = entries
+        self._raw_lower = [
+            entry.raw_line.lower() if hasattr(entry, "raw_line") else ""
+            for entry in entries
+        ]
         self._build_field_index()
         self._build_timestamp_index()
+        # Built on the first search that needs them
+        self.numeric_columns = {}
+        self.token_index = None
+        self.trigram_index = None
+        self._corpus = None
+        self._result_cache.clear()
 
     def _build_field_index(self):
-        self.field_index.clear()
+        """Store each field as a column: parallel lists of entry ids and values.
+
+        Values are kept both lowercased and in their original case, for
+        case-insensitive and case-sensitive filters respectively. Exact
+        lowercased values also map to their entry ids, so case-insensitive
+        filters test each distinct value once.
+        """
+        columns = {}
+        value_index = {}
         for i, entry in enumerate(self.entries):
             if hasattr(entry, "fields"):
                 for field_name, value in entry.fields.items():
                     if value is not None:
-                        self.field_index[field_name].append((i, str(value).lower()))
+                        column = columns.get(field_name)
+                        if column is None:
+                            field_name = sys.intern(field_name)
+                            column = columns[field_name] = ([], [], [])
+                            value_index[field_name] = defaultdict(list)
+                        value = str(value)
+                        value_lower = value.lower()
+                        column[0].append(i)
+                        column[1].append(value_lower)
+                        column[2].append(value)
+                        value_index[field_name][value_lower].append(i)
+        self.columns = columns
+        self.value_index = {
+            field_name: dict(postings) for field_name, postings in value_index.items()
+        }
+
+    def _build_token_index(self):
+        """Map each lowercased token of raw lines and field values to entry ids."""
+        token_index = defaultdict(list)
+        for i, entry in enumerate(self.entries):
+            tokens = set(TOKEN.findall(self._raw_lower[i]))
+            if hasattr(entry, "fields"):
+                for value in entry.fields.values():
+                    if value:
+                        tokens.update(TOKEN.findall(str(value).lower()))
+            for token in tokens:
+                token_index[token].append(i)
+        self.token_index = dict(token_index)
+
+        # Every token in one string, so the tokens containing a query token
+        # are found with str.find instead of a loop over the vocabulary
+        self._vocabulary = list(self.token_index)
+        self._vocabulary_text = CORPUS_SEPARATOR.join(self._vocabulary)
+        starts = []
+        offset = 0
+        for token in self._vocabulary:
+            starts.append(offset)
+            offset += len(token) + 1
+        self._vocabulary_starts = starts
+
+    def _build_trigram_index(self):
+        """Map each lowercased 3-character substring to the entries containing it."""
+        trigram_index = defaultdict(list)
+        for i, entry in enumerate(self.entries):
+            texts = [self._raw_lower[i]]
+            if hasattr(entry, "fields"):
+                texts.extend(
+                    str(value).lower() for value in entry.fields.values() if value
+                )
+            trigrams = set()
+            for text in texts:
+                trigrams.update(text[j : j + 3] for j in range(len(text) - 2))
+            for trigram in trigrams:
+                trigram_index[trigram].append(i)
+        self.trigram_index = dict(trigram_index)
+
+    def _build_corpus(self):
+        """Join every entry's searchable text into one string for str.find scans."""
+        segments = []
+        starts = []
+        offset = 0
+        for i, entry in enumerate(self.entries):
+            texts = [self._raw_lower[i]]
+            if hasattr(entry, "fields"):
+                texts.extend(
+                    str(value).lower() for value in entry.fields.values() if value
+                )
+            segment = CORPUS_SEPARATOR.join(texts)
+            segments.append(segment)
+            starts.append(offset)
+            offset += len(segment) + 1
+        self._corpus = CORPUS_SEPARATOR.join(segments)
+        self._corpus_starts = starts
 
     def _build_timestamp_index(self):
-        self.timestamp_index = []
-        for i, entry in enumerate(self.entries):
-            if hasattr(entry, "timestamp") and entry.timestamp:
-                self.timestamp_index.append((i, entry.timestamp))
-        self.timestamp_index.sort(key=lambda x: x[1])
+        """Keep timestamps sorted with their entry ids in a parallel list.
+
+        Each entry's position in that order is kept too (-1 if it has no
+        timestamp), so a time window can also be checked per entry. Logs
+        usually arrive in time order, in which case the sorted ids ascend
+        and any window of them is already in result order.
+        """
+        timestamped = [
+            (i, entry.timestamp)
+            for i, entry in enumerate(self.entries)
+            if hasattr(entry, "timestamp") and entry.timestamp
+        ]
+        timestamped.sort(key=lambda x: x[1])
+        self._ts_sorted_ids = [i for i, _ in timestamped]
+        self._ts_sorted_ts = [timestamp for _, timestamp in timestamped]
+        self._ts_rank = [-1] * len(self.entries)
+        for position, i in enumerate(self._ts_sorted_ids):
+            self._ts_rank[i] = position
+        self._ts_in_entry_order = all(
+            a < b for a, b in zip(self._ts_sorted_ids, self._ts_sorted_ids[1:])
+        )
 
     def search(self, query):
-        start_time = datetime.now()
+        start = time.perf_counter()
 
         if not self.entries:
             return SearchResult([], 0, 0.0, query)
 
-        matches = set(range(len(self.entries)))
+        key = self._query_key(query)
+        cached = self._result_cache.get(key) if key is not None else None
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            search_time = time.perf_counter() - start
+            return SearchResult(
+                list(cached.entries),
+                cached.total_matches,
+                search_time,
+                query,
+                cached.field_counts,
+                list(cached.ids),
+            )
 
-        # Apply text search
+        # Apply the most selective constraint first so the running
+        # intersection stays small, and stop as soon as nothing is left.
+        # Steps that can test entries one by one are given a refine
+        # function, so later ones narrow the matches instead of building
+        # their own, larger candidate set.
+        steps = []
+        window = None
         if query.text:
-            text_matches = self._text_search(query.text)
-            matches &= text_matches
-
-        # Apply field filters
+            steps.append(
+                (self._estimate_text(query.text), self._text_search, None, query.text)
+            )
         for filter_obj in query.filters:
-            filter_matches = self._apply_filter(filter_obj)
-            matches &= filter_matches
-
-        # Apply time filter
+            steps.append(
+                (
+                    self._estimate_filter(filter_obj),
+                    self._apply_filter,
+                    None,
+                    filter_obj,
+                )
+            )
         if query.time_filter:
-            time_matches = self._apply_time_filter(query.time_filter)
-            matches &= time_matches
-
-        # Convert to sorted list
-        matches = sorted(list(matches), key=lambda x: x)
+            window = self._time_window(query.time_filter)
+            if window is not None:
+                lo, hi = window
+                steps.append(
+                    (hi - lo, self._window_ids, self._refine_by_window, window)
+                )
+        steps.sort(key=lambda step: step[0])
+
+        if window is not None and len(steps) == 1 and self._ts_in_entry_order:
+            # A lone time window over time-ordered entries is a ready result
+            matches = self._window_ids(window)
+        else:
+            # None stands for "every entry" so the universe is never materialized
+            matches = None
+            for _, produce, refine, argument in steps:
+                if matches is not None and refine is not None:
+                    matches = refine(matches, argument)
+                else:
+                    matches = self._intersect(matches, produce(argument))
+                if matches is not None and not matches:
+                    break
+
+            # Sort once at the end; with no constraints the range is in order
+            matches = range(len(self.entries)) if matches is None else sorted(matches)
 
         # Apply pagination
         total_matches = len(matches)
@@ -104,87 +313,252 @@ class LogSearchEngine:
         # Calculate field counts for faceting
         field_counts = self._calculate_field_counts(result_entries)
 
-        search_time = (datetime.now() - start_time).total_seconds()
+        search_time = time.perf_counter() - start
 
-        return SearchResult(
-            result_entries, total_matches, search_time, query, field_counts
+        result = SearchResult(
+            result_entries,
+            total_matches,
+            search_time,
+            query,
+            field_counts,
+            list(matches),
         )
+        if key is not None:
+            self._result_cache[key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
 
-    def _text_search(self, text):
-        matches = set()
-        text_lower = text.lower()
+    @staticmethod
+    def _query_key(query):
+        """Hashable form of a query, or None if its result depends on the clock."""
+        time_filter = query.time_filter
+        if time_filter and (time_filter.last_hours or time_filter.last_minutes):
+            return None
+        return (
+            query.text,
+            tuple(
+                (f.field_name, f.value, f.operator, f.case_sensitive)
+                for f in query.filters
+            ),
+            (time_filter.start_time, time_filter.end_time) if time_filter else None,
+            query.limit,
+            query.offset,
+        )
 
-        for i, entry in enumerate(self.entries):
-            # Search in raw line
-            if hasattr(entry, "raw_line") and text_lower in entry.raw_line.lower():
-                matches.add(i)
-                continue
+    def _estimate_text(self, text):
+        """Upper bound on text matches: the rarest query trigram, if indexed."""
+        text_lower = text.lower()
+        if len(text_lower) < 3 or self.trigram_index is None:
+            return len(self.entries)
+        return min(
+            len(self.trigram_index.get(text_lower[j : j + 3], ()))
+            for j in range(len(text_lower) - 2)
+        )
 
-            # Search in fields
-            if hasattr(entry, "fields"):
-                for value in entry.fields.values():
-                    if value and text_lower in str(value).lower():
-                        matches.add(i)
-                        break
+    def _estimate_filter(self, filter_obj):
+        """Upper bound on filter matches from the value index or column size."""
+        column = self.columns.get(filter_obj.field_name)
+        if column is None:
+            return 0
+        if filter_obj.operator == "equals" and not filter_obj.case_sensitive:
+            postings = self.value_index[filter_obj.field_name]
+            return len(postings.get(filter_obj.value.lower(), ()))
+        return len(column[0])
+
+    def multi_text_search(self, patterns):
+        """Match several text patterns at once.
+
+        Returns {pattern: sorted entry ids}. Patterns differing only in case
+        share a single lookup.
+        """
+        by_lower = {}
+        for pattern in patterns:
+            text_lower = pattern.lower()
+            if text_lower not in by_lower:
+                by_lower[text_lower] = sorted(self._text_search(text_lower))
+        return {pattern: by_lower[pattern.lower()] for pattern in patterns}
+
+    def _window_ids(self, window):
+        lo, hi = window
+        return self._ts_sorted_ids[lo:hi]
+
+    def _refine_by_window(self, matches, window):
+        lo, hi = window
+        rank = self._ts_rank
+        return {i for i in matches if lo <= rank[i] < hi}
 
+    @staticmethod
+    def _intersect(matches, candidates):
+        if candidates is None:
+            return matches
+        if matches is None:
+            return set(candidates)
+        if matches:
+            matches.intersection_update(candidates)
         return matches
 
-    def _apply_filter(self, filter_obj):
-        matches = set()
-
-        if filter_obj.field_name not in self.field_index:
-            return matches
+    def _text_search(self, text):
+        text_lower = text.lower()
+        if len(text_lower) >= 3:
+            candidates = self._trigram_candidates(text_lower)
+        else:
+            candidates = self._token_candidates(text_lower)
+        if candidates is None:
+            if CORPUS_SEPARATOR not in text_lower:
+                return self._scan_corpus(text_lower)
+            candidates = range(len(self.entries))
+
+        # Search in raw line, then in fields; ids are collected in one pass
+        raw_lower = self._raw_lower
+        entries = self.entries
+        return [
+            i
+            for i in candidates
+            if text_lower in raw_lower[i]
+            or self._fields_contain(entries[i], text_lower)
+        ]
 
-        for entry_idx, field_value in self.field_index[filter_obj.field_name]:
-            if self._match_filter(field_value, filter_obj):
-                matches.add(entry_idx)
+    @staticmethod
+    def _fields_contain(entry, text_lower):
+        if hasattr(entry, "fields"):
+            for value in entry.fields.values():
+                if value and text_lower in str(value).lower():
+                    return True
+        return False
 
+    def _scan_corpus(self, text_lower):
+        """Find every entry containing the text with str.find over the corpus.
+
+        After each hit the scan resumes at the next entry, so the loop runs
+        once per matching entry rather than once per entry.
+        """
+        if self._corpus is None:
+            self._build_corpus()
+
+        corpus = self._corpus
+        starts = self._corpus_starts
+        matches = []
+        pos = corpus.find(text_lower)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            matches.append(i)
+            if i + 1 == len(starts):
+                break
+            pos = corpus.find(text_lower, starts[i + 1])
         return matches
 
-    def _match_filter(self, field_value, filter_obj):
-        target = filter_obj.value
+    def _trigram_candidates(self, text_lower):
+        """Entries containing every trigram of the query, rarest first."""
+        if self.trigram_index is None:
+            self._build_trigram_index()
+
+        postings = []
+        for trigram in {text_lower[j : j + 3] for j in range(len(text_lower) - 2)}:
+            posting = self.trigram_index.get(trigram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidates = None
+        for posting in postings:
+            candidates = self._intersect(candidates, posting)
+            if not candidates:
+                break
+        return candidates
+
+    def _token_candidates(self, text_lower):
+        """Entries whose tokens could contain the query, or None to scan all.
+
+        Every token of a substring match lies inside some token of the
+        matched text, so candidates only need verifying, never widening.
+        """
+        query_tokens = set(TOKEN.findall(text_lower))
+        if not query_tokens:
+            return None
+
+        if self.token_index is None:
+            self._build_token_index()
+
+        candidates = None
+        for query_token in query_tokens:
+            ids = set()
+            for token in self._tokens_containing(query_token):
+                ids.update(self.token_index[token])
+            candidates = self._intersect(candidates, ids)
+            if not candidates:
+                break
+        return candidates
+
+    def _tokens_containing(self, query_token):
+        vocabulary = self._vocabulary
+        text = self._vocabulary_text
+        starts = self._vocabulary_starts
+        tokens = []
+        pos = text.find(query_token)
+        while pos != -1:
+            k = bisect_right(starts, pos) - 1
+            tokens.append(vocabulary[k])
+            if k + 1 == len(starts):
+                break
+            pos = text.find(query_token, starts[k + 1])
+        return tokens
 
-        if not filter_obj.case_sensitive:
-            target = target.lower()
-        else:
-            field_value = self.entries[0].fields.get(filter_obj.field_name, "")
-
-        if filter_obj.operator == "contains":
-            return target in field_value
-        elif filter_obj.operator == "equals":
-            return target == field_value
-        elif filter_obj.operator == "regex":
-            try:
-                flags = 0 if filter_obj.case_sensitive else re.IGNORECASE
-                return bool(re.search(target, field_value, flags))
-            except re.error:
-                return False
-        elif filter_obj.operator in ["gt", "lt", "gte", "lte"]:
-            return self._numeric_compare(field_value, target, filter_obj.operator)
+    def _apply_filter(self, filter_obj):
+        matches = set()
 
-        return False
+        column = self.columns.get(filter_obj.field_name)
+        if column is None:
+            return matches
 
-    def _numeric_compare(self, field_value, target, operator):
-        try:
-            field_num = float(field_value)
-            target_num = float(target)
-
-            if operator == "gt":
-                return field_num > target_num
-            elif operator == "lt":
-                return field_num < target_num
-            elif operator == "gte":
-                return field_num >= target_num
-            elif operator == "lte":
-                return field_num <= target_num
-        except (ValueError, TypeError):
-            pass
+        matcher = filter_obj.get_matcher()
+        if matcher is None:
+            return matches
 
-        return False
+        if not filter_obj.case_sensitive:
+            postings = self.value_index[filter_obj.field_name]
+            # Case-insensitive equality is a single hash lookup
+            if filter_obj.operator == "equals":
+                return postings.get(filter_obj.value.lower(), [])
+            # Repeated values are tested once each, not once per row
+            if len(postings) < len(column[0]):
+                for value_lower, posting in postings.items():
+                    if matcher(value_lower):
+                        matches.update(posting)
+                return matches
+
+        compare = NUMERIC_COMPARISONS.get(filter_obj.operator)
+        if compare is not None:
+            ids, numbers = self._numeric_column(filter_obj.field_name)
+            target = float(filter_obj.value)
+            return {i for i, number in zip(ids, numbers) if compare(number, target)}
+
+        ids, values_lower, values_cased = column
+        values = values_cased if filter_obj.case_sensitive else values_lower
+        for entry_idx, field_value in zip(ids, values):
+            if matcher(field_value):
+                matches.add(entry_idx)
 
-    def _apply_time_filter(self, time_filter):
-        matches = set()
+        return matches
 
+    def _numeric_column(self, field_name):
+        """The field's numeric values as floats, parsed once, with their ids."""
+        numeric_column = self.numeric_columns.get(field_name)
+        if numeric_column is None:
+            ids, numbers = [], []
+            column_ids, _, values = self.columns[field_name]
+            for i, value in zip(column_ids, values):
+                try:
+                    numbers.append(float(value))
+                except ValueError:
+                    continue
+                ids.append(i)
+            numeric_column = self.numeric_columns[field_name] = (ids, numbers)
+        return numeric_column
+
+    def _time_window(self, time_filter):
+        """Bounds of the filter's slice of the sorted timestamps, or None if unbounded."""
         start_time = time_filter.start_time
         end_time = time_filter.end_time
 
@@ -197,43 +571,148 @@ class LogSearchEngine:
             start_time = end_time - timedelta(minutes=time_filter.last_minutes)
 
         if not start_time and not end_time:
-            return set(range(len(self.entries)))
-
-        for entry_idx, timestamp in self.timestamp_index:
-            if start_time and timestamp < start_time:
-                continue
-            if end_time and timestamp > end_time:
-                break
-            matches.add(entry_idx)
-
-        return matches
+            return None
+
+        # The window is a contiguous slice of the sorted timestamps; an end
+        # past the newest entry (e.g. "now") needs no search
+        timestamps = self._ts_sorted_ts
+        lo = bisect_left(timestamps, start_time) if start_time else 0
+        if not end_time or not timestamps or timestamps[-1] <= end_time:
+            hi = len(timestamps)
+        else:
+            hi = bisect_right(timestamps, end_time)
+        return lo, hi
 
     def _calculate_field_counts(self, entries):
-        field_counts = defaultdict(lambda: defaultdict(int))
-
-        for entry in entries:
-            if hasattr(entry, "fields"):
-                for field_name, value in entry.fields.items():
-                    if value is not None:
-                        field_counts[field_name][str(value)] += 1
+        field_counts = {}
 
-        # Convert to regular dict and limit top values
-        result = {}
-        for field_name, value_counts in field_counts.items():
-            sorted_counts = sorted(
-                value_counts.items(), key=lambda x: x[1], reverse=True
+        # Most fields take few distinct values, so count them first and
+        # stringify each distinct value once. The type is part of the key
+        # because 1, True and 1.0 hash equal but are shown as different strings
+        try:
+            pairs = Counter(
+                (field_name, type(value), value)
+                for entry in entries
+                if hasattr(entry, "fields")
+                for field_name, value in entry.fields.items()
+            )
+        except TypeError:
+            # Unhashable field values: stringify every value as it is counted
+            pairs = Counter(
+                (field_name, str, str(value))
+                for entry in entries
+                if hasattr(entry, "fields")
+                for field_name, value in entry.fields.items()
+                if value is not None
             )
-            result[field_name] = dict(sorted_counts[:10])  # Top 10 values
 
-        return result
+        for (field_name, _, value), count in pairs.items():
+            if value is not None:
+                counts = field_counts.get(field_name)
+                if counts is None:
+                    counts = field_counts[field_name] = Counter()
+                counts[str(value)] += count
+
+        # Limit to the top 10 values per field
+        return {
+            field_name: dict(counts.most_common(10))
+            for field_name, counts in field_counts.items()
+        }
 
     def get_field_names(self):
-        return list(self.field_index.keys())
+        return list(self.columns.keys())
 
     def get_time_range(self):
-        if not self.timestamp_index:
+        if not self._ts_sorted_ts:
             return None, None
-        return self.timestamp_index[0][1], self.timestamp_index[-1][1]
+        return self._ts_sorted_ts[0], self._ts_sorted_ts[-1]
+
+
+def _build_matcher(operator, value, case_sensitive):
+    """Predicate for one filter; the needle is case-folded and compiled once."""
+    if value is None:
+        return None
+
+    if operator == "regex":
+        compiled = _compile_regex(value, case_sensitive)
+        if compiled is None:
+            return None
+        search = compiled.search
+        literal, anchored = _leading_literal(value)
+        if not case_sensitive:
+            literal = literal.lower()
+            for i, char in enumerate(literal):
+                if char in AMBIGUOUS_FOLDS:
+                    literal = literal[:i]
+                    break
+        if not literal:
+            return search
+        # Cheap substring check first; the regex only runs on candidates
+        if anchored:
+            return lambda field_value: field_value.startswith(literal) and search(
+                field_value
+            )
+        return lambda field_value: literal in field_value and search(field_value)
+
+    target = value if case_sensitive else value.lower()
+    if operator == "contains":
+        return lambda field_value: target in field_value
+    if operator == "equals":
+        return lambda field_value: field_value == target
+
+    compare = NUMERIC_COMPARISONS.get(operator)
+    if compare is None:
+        return None
+    try:
+        target_num = float(target)
+    except ValueError:
+        return None
+
+    def numeric_matcher(field_value):
+        try:
+            return compare(float(field_value), target_num)
+        except ValueError:
+            return False
+
+    return numeric_matcher
+
+
+def _leading_literal(pattern):
+    """Plain ASCII text every match of the pattern starts with, and whether
+    the pattern is anchored at "^". Patterns with alternation have none.
+    """
+    if "|" in pattern:
+        return "", False
+    anchored = pattern.startswith("^")
+    body = pattern[1:] if anchored else pattern
+
+    end = 0
+    while (
+        end < len(body)
+        and body[end] not in REGEX_METACHARACTERS
+        and ord(body[end]) < 128
+    ):
+        end += 1
+    # A quantified last character may be absent
+    if end < len(body) and body[end] in "?*{":
+        end -= 1
+    return body[: max(end, 0)], anchored
+
+
+def _compile_regex(pattern, case_sensitive):
+    """Compile with RE2 when installed, falling back to re for what it rejects.
+
+    Returns None for patterns neither engine accepts.
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern if case_sensitive else "(?i)" + pattern)
+        except _re2.error:
+            pass
+    try:
+        return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+    except re.error:
+        return None
 
 
 class QueryBuilder:
@@ -286,22 +765,13 @@ def search_errors(search_engine, limit=100):
         SearchFilter("status", "5", "contains", False),  # HTTP 5xx errors
     ]
 
-    results = []
+    # Merge by entry position so results keep log order without duplicates
+    ids = set()
     for filter_obj in filters:
         query = SearchQuery(filters=[filter_obj], limit=limit)
-        result = search_engine.search(query)
-        results.extend(result.entries)
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_results = []
-    for entry in results:
-        entry_id = id(entry)
-        if entry_id not in seen:
-            seen.add(entry_id)
-            unique_results.append(entry)
-
-    return unique_results[:limit]
+        ids.update(search_engine.search(query).ids)
+
+    return [search_engine.entries[i] for i in sorted(ids)[:limit]]
 
 
 def search_by_ip(search_engine, ip_address, limit=100):
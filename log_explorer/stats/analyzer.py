@@ -1,13 +1,38 @@
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-import statistics
-from dataclasses import dataclass, field
+from itertools import islice
+from operator import attrgetter, methodcaller
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional
 
+from log_explorer.inference.inference_engine import LogSchemaInferenceEngine
+from log_explorer.parser.parsing_engine import LogParsingEngine
 
+# Recommendation thresholds
+LOW_DETECTION_CONFIDENCE = 0.7
+LOW_SUCCESS_RATE = 0.8
+POOR_EXTRACTION_RATE = 0.5
+HIGH_NULL_RATE = 0.3
+FREQUENT_ERROR_SHARE = 0.1
+
+
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__; dataclass(slots=True) needs Python 3.10."""
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class TimeSeriesStats:
-    timestamps: List[datetime] = field(default_factory=list)
+    timestamps: List[datetime] = field(default_factory=list)  # In log order
     counts_per_hour: Dict[int, int] = field(default_factory=dict)
     counts_per_day: Dict[str, int] = field(default_factory=dict)
     peak_hour: int = 0
@@ -16,6 +41,7 @@ class TimeSeriesStats:
     entries_per_second: float = 0.0
 
 
+@_slotted
 @dataclass
 class FieldStats:
     name: str
@@ -29,6 +55,7 @@ class FieldStats:
     null_rate: float = 0.0
 
 
+@_slotted
 @dataclass
 class FormatStats:
     format_type: str
@@ -40,6 +67,7 @@ class FormatStats:
     sample_line_count: int
 
 
+@_slotted
 @dataclass
 class ParsingStats:
     total_lines: int
@@ -51,6 +79,7 @@ class ParsingStats:
     field_extraction_rates: Dict[str, float] = field(default_factory=dict)
 
 
+@_slotted
 @dataclass
 class LogInsights:
     format_stats: FormatStats
@@ -61,6 +90,48 @@ class LogInsights:
     recommendations: List[str] = field(default_factory=list)
 
 
+def quality_score(
+    detection_confidence, success_rate, avg_extraction_rate, average_confidence
+):
+    """Weighted 0-1 quality score from the four per-file rates.
+
+    Detection is worth 30 points, parsing success 40, field extraction 20
+    and parse confidence 10. Plain floats in and out, so batch callers can
+    score files without building stats objects.
+    """
+    total_score = (
+        detection_confidence * 30
+        + success_rate * 40
+        + avg_extraction_rate * 20
+        + average_confidence * 10
+    )
+    return min(total_score / 100.0, 1.0)  # Normalize to 0-1
+
+
+class StatCounter:
+    """Running count, mean and variance (Welford's method) without keeping values."""
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self, values=()):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        for value in values:
+            self.add(value)
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self):
+        """Sample variance, as statistics.variance; 0.0 below two values."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
 class LogStatsAnalyzer:
 
     def __init__(self):
@@ -70,14 +141,52 @@ class LogStatsAnalyzer:
         self.detection_results = []
         self.parse_results = []
         self.log_entries = []
+        # Whether every entry has fields and timestamp; checked once per batch
+        self._entries_have_fields = True
+        # Bumped on every add so analyze() can reuse its last result
+        self._version = 0
+        self._cached_insights = None
+        # Time-series state, updated as parse results arrive
+        self._rebuild_time_series_state()
 
     def add_detection_result(self, detection_result):
         self.detection_results.append(detection_result)
+        self._version += 1
 
     def add_parse_result(self, parse_result):
         self.parse_results.append(parse_result)
+        self._version += 1
         if hasattr(parse_result, "entries"):
-            self.log_entries.extend(parse_result.entries)
+            entries = parse_result.entries
+            self.log_entries.extend(entries)
+            if entries and not (
+                hasattr(entries[0], "fields") and hasattr(entries[0], "timestamp")
+            ):
+                self._entries_have_fields = False
+            self._add_timestamps(entries)
+
+    def _add_timestamps(self, entries):
+        if self._entries_have_fields:
+            timestamps = [entry.timestamp for entry in entries if entry.timestamp]
+        else:
+            timestamps = [
+                entry.timestamp
+                for entry in entries
+                if getattr(entry, "timestamp", None)
+            ]
+        self._streamed_entries += len(entries)
+        if not timestamps:
+            return
+
+        self._timestamps.extend(timestamps)
+        self._hour_counts.update(map(attrgetter("hour"), timestamps))
+        self._day_counts.update(map(methodcaller("date"), timestamps))
+        batch_min, batch_max = min(timestamps), max(timestamps)
+        if self._ts_min is None:
+            self._ts_min, self._ts_max = batch_min, batch_max
+        else:
+            self._ts_min = min(self._ts_min, batch_min)
+            self._ts_max = max(self._ts_max, batch_max)
 
     def analyze(self):
         if not self.detection_results and not self.parse_results:
@@ -86,6 +195,9 @@ class LogStatsAnalyzer:
                 parsing_stats=ParsingStats(0, 0, 0, 0.0, 0.0),
             )
 
+        if self._cached_insights and self._cached_insights[0] == self._version:
+            return self._cached_insights[1]
+
         # Use the best detection result if multiple exist
         detection_result = (
             max(self.detection_results, key=lambda x: x.confidence)
@@ -104,7 +216,9 @@ class LogStatsAnalyzer:
         parsing_stats = (
             self._analyze_parsing_performance(parse_result) if parse_result else None
         )
-        field_stats = self._analyze_field_statistics(detection_result, parse_result)
+        field_stats = self._analyze_field_statistics(
+            detection_result, parse_result, self._collect_field_columns()
+        )
         time_series_stats = self._analyze_time_series()
 
         quality_score = self._calculate_quality_score(format_stats, parsing_stats)
@@ -112,7 +226,7 @@ class LogStatsAnalyzer:
             format_stats, parsing_stats, field_stats
         )
 
-        return LogInsights(
+        insights = LogInsights(
             format_stats=format_stats or FormatStats("unknown", 0.0, 0, 0, 0, 0, 0),
             parsing_stats=parsing_stats or ParsingStats(0, 0, 0, 0.0, 0.0),
             field_stats=field_stats,
@@ -120,58 +234,57 @@ class LogStatsAnalyzer:
             quality_score=quality_score,
             recommendations=recommendations,
         )
+        self._cached_insights = (self._version, insights)
+        return insights
 
     def _aggregate_parse_results(self):
         if not self.parse_results:
             return None
 
+        # A single result already has everything the analyses read
+        if len(self.parse_results) == 1 and hasattr(
+            self.parse_results[0], "success_rate"
+        ):
+            return self.parse_results[0]
+
         # Combine all parse results into a single aggregated result
         total_lines = sum(r.total_lines for r in self.parse_results)
         successfully_parsed = sum(r.successfully_parsed for r in self.parse_results)
         malformed_lines = sum(r.malformed_lines for r in self.parse_results)
 
         # Aggregate statistics
-        all_stats = {}
+        field_rates_acc = defaultdict(StatCounter)
+        error_acc = Counter()
+        confidence_acc = StatCounter()
         for result in self.parse_results:
-            if hasattr(result, "parse_statistics") and result.parse_statistics:
-                for key, value in result.parse_statistics.items():
-                    if key == "field_extraction_rates" and isinstance(value, dict):
-                        if key not in all_stats:
-                            all_stats[key] = defaultdict(list)
-                        for field, rate_info in value.items():
-                            if (
-                                isinstance(rate_info, dict)
-                                and "extraction_rate" in rate_info
-                            ):
-                                all_stats[key][field].append(
-                                    rate_info["extraction_rate"]
-                                )
-                    elif key == "error_types" and isinstance(value, dict):
-                        if key not in all_stats:
-                            all_stats[key] = Counter()
-                        all_stats[key].update(value)
-                    elif key == "average_confidence":
-                        if key not in all_stats:
-                            all_stats[key] = []
-                        all_stats[key].append(value)
+            stats = getattr(result, "parse_statistics", None)
+            if not stats:
+                continue
 
-        # Calculate final aggregated statistics
-        final_stats = {}
-        if "field_extraction_rates" in all_stats:
-            final_stats["field_extraction_rates"] = {}
-            for field, rates in all_stats["field_extraction_rates"].items():
-                final_stats["field_extraction_rates"][field] = {
-                    "extraction_rate": statistics.mean(rates),
-                    "total_extracted": int(statistics.mean(rates) * total_lines),
-                }
+            field_rates = stats.get("field_extraction_rates")
+            if isinstance(field_rates, dict):
+                for field, rate_info in field_rates.items():
+                    if isinstance(rate_info, dict) and "extraction_rate" in rate_info:
+                        field_rates_acc[field].add(rate_info["extraction_rate"])
 
-        if "error_types" in all_stats:
-            final_stats["error_types"] = dict(all_stats["error_types"])
+            error_types = stats.get("error_types")
+            if isinstance(error_types, dict):
+                error_acc.update(error_types)
 
-        if "average_confidence" in all_stats:
-            final_stats["average_confidence"] = statistics.mean(
-                all_stats["average_confidence"]
-            )
+            if "average_confidence" in stats:
+                confidence_acc.add(stats["average_confidence"])
+
+        # Calculate final aggregated statistics
+        final_stats = {"field_extraction_rates": {}, "error_types": dict(error_acc)}
+        for field, rates in field_rates_acc.items():
+            mean_rate = rates.mean
+            final_stats["field_extraction_rates"][field] = {
+                "extraction_rate": mean_rate,
+                "total_extracted": int(mean_rate * total_lines),
+            }
+
+        if confidence_acc.count:
+            final_stats["average_confidence"] = confidence_acc.mean
 
         # Create a mock parse result object
         class AggregatedParseResult:
@@ -187,15 +300,14 @@ class LogStatsAnalyzer:
         return AggregatedParseResult()
 
     def _analyze_format_detection(self, detection_result):
-        timestamp_fields = sum(
-            1 for field in detection_result.schema.values() if field.is_timestamp
-        )
-        high_confidence_fields = sum(
-            1 for field in detection_result.schema.values() if field.confidence >= 0.8
-        )
-        low_confidence_fields = sum(
-            1 for field in detection_result.schema.values() if field.confidence < 0.5
-        )
+        timestamp_fields = high_confidence_fields = low_confidence_fields = 0
+        for field in detection_result.schema.values():
+            if field.is_timestamp:
+                timestamp_fields += 1
+            if field.confidence >= 0.8:
+                high_confidence_fields += 1
+            elif field.confidence < 0.5:
+                low_confidence_fields += 1
 
         return FormatStats(
             format_type=detection_result.format_type.value,
@@ -236,7 +348,22 @@ class LogStatsAnalyzer:
             field_extraction_rates=field_rates,
         )
 
-    def _analyze_field_statistics(self, detection_result, parse_result):
+    def _collect_field_columns(self):
+        """One pass over the entries, returning {field: values} columns."""
+        field_columns = defaultdict(list)
+
+        if self._entries_have_fields:
+            for entry in self.log_entries:
+                for field_name, value in entry.fields.items():
+                    field_columns[field_name].append(value)
+        else:
+            for entry in self.log_entries:
+                for field_name, value in getattr(entry, "fields", {}).items():
+                    field_columns[field_name].append(value)
+
+        return field_columns
+
+    def _analyze_field_statistics(self, detection_result, parse_result, field_columns):
         field_stats = []
 
         # Start with detection schema if available
@@ -263,18 +390,22 @@ class LogStatsAnalyzer:
                 ].items():
                     extraction_rates[field] = info
 
-        # Analyze actual log entries for more detailed field stats
-        field_value_counts = defaultdict(Counter)
-        field_null_counts = defaultdict(int)
+        # Analyze actual log entries for more detailed field stats: count
+        # each field's column at once. Nulls (None and "") are counted with
+        # the rest and split off after.
         total_entries = len(self.log_entries)
 
-        for entry in self.log_entries:
-            if hasattr(entry, "fields"):
-                for field_name, value in entry.fields.items():
-                    if value is None or value == "":
-                        field_null_counts[field_name] += 1
-                    else:
-                        field_value_counts[field_name][value] += 1
+        field_value_counts = defaultdict(Counter)
+        field_null_counts = defaultdict(int)
+        field_value_totals = {}
+        for field_name, values in field_columns.items():
+            counts = Counter(values)
+            null_count = counts.pop(None, 0) + counts.pop("", 0)
+            if null_count:
+                field_null_counts[field_name] = null_count
+            if counts:
+                field_value_counts[field_name] = counts
+                field_value_totals[field_name] = len(values) - null_count
 
         # Combine all field information
         all_fields = (
@@ -287,8 +418,13 @@ class LogStatsAnalyzer:
             info = field_info_map.get(field_name, {})
             extraction_info = extraction_rates.get(field_name, {})
 
-            unique_values = len(field_value_counts[field_name])
-            most_common = field_value_counts[field_name].most_common(5)
+            value_counts = field_value_counts[field_name]
+            unique_values = len(value_counts)
+            if unique_values == field_value_totals.get(field_name, 0):
+                # All values distinct (ids, URLs): the top 5 are the first 5 seen
+                most_common = [(value, 1) for value in islice(value_counts, 5)]
+            else:
+                most_common = value_counts.most_common(5)
             null_rate = (
                 field_null_counts[field_name] / total_entries
                 if total_entries > 0
@@ -310,40 +446,38 @@ class LogStatsAnalyzer:
 
         return sorted(field_stats, key=lambda x: x.extraction_rate, reverse=True)
 
-    def _analyze_time_series(self):
-        if not self.log_entries:
-            return None
+    def _rebuild_time_series_state(self):
+        self._timestamps = []
+        self._hour_counts = Counter()
+        self._day_counts = Counter()
+        self._ts_min = None
+        self._ts_max = None
+        self._streamed_entries = 0
+        self._add_timestamps(self.log_entries)
 
-        timestamps = []
-        for entry in self.log_entries:
-            if hasattr(entry, "timestamp") and entry.timestamp:
-                timestamps.append(entry.timestamp)
+    def _analyze_time_series(self):
+        # Entries assigned directly rather than added: batch over all of them
+        if self._streamed_entries != len(self.log_entries):
+            self._rebuild_time_series_state()
 
+        timestamps = self._timestamps
         if not timestamps:
             return None
 
-        timestamps.sort()
-
-        # Count by hour and day
-        counts_per_hour = defaultdict(int)
-        counts_per_day = defaultdict(int)
-
-        for ts in timestamps:
-            counts_per_hour[ts.hour] += 1
-            counts_per_day[ts.strftime("%Y-%m-%d")] += 1
+        # Hour and day counts are maintained as entries arrive; dates are
+        # formatted once per distinct day. Keys are kept in ascending order,
+        # so peak ties go to the earliest.
+        counts_per_hour = dict(sorted(self._hour_counts.items()))
+        counts_per_day = {
+            day.isoformat(): count for day, count in sorted(self._day_counts.items())
+        }
 
         peak_hour = (
-            max(counts_per_hour.items(), key=lambda x: x[1])[0]
-            if counts_per_hour
-            else 0
-        )
-        peak_day = (
-            max(counts_per_day.items(), key=lambda x: x[1])[0] if counts_per_day else ""
+            max(counts_per_hour, key=counts_per_hour.get) if counts_per_hour else 0
         )
+        peak_day = max(counts_per_day, key=counts_per_day.get) if counts_per_day else ""
 
-        time_range = (
-            timestamps[-1] - timestamps[0] if len(timestamps) > 1 else timedelta(0)
-        )
+        time_range = self._ts_max - self._ts_min
         entries_per_second = (
             len(timestamps) / time_range.total_seconds()
             if time_range.total_seconds() > 0
@@ -351,9 +485,9 @@ class LogStatsAnalyzer:
         )
 
         return TimeSeriesStats(
-            timestamps=timestamps,
-            counts_per_hour=dict(counts_per_hour),
-            counts_per_day=dict(counts_per_day),
+            timestamps=list(timestamps),
+            counts_per_hour=counts_per_hour,
+            counts_per_day=counts_per_day,
             peak_hour=peak_hour,
             peak_day=peak_day,
             time_range=time_range,
@@ -364,26 +498,14 @@ class LogStatsAnalyzer:
         if not format_stats or not parsing_stats:
             return 0.0
 
-        # Detection quality component (0-30 points)
-        detection_score = format_stats.detection_confidence * 30
-
-        # Parsing success component (0-40 points)
-        parsing_score = parsing_stats.success_rate * 40
-
-        # Field extraction quality component (0-20 points)
-        if parsing_stats.field_extraction_rates:
-            avg_extraction_rate = statistics.mean(
-                parsing_stats.field_extraction_rates.values()
-            )
-            field_score = avg_extraction_rate * 20
-        else:
-            field_score = 0
-
-        # Confidence component (0-10 points)
-        confidence_score = parsing_stats.average_confidence * 10
-
-        total_score = detection_score + parsing_score + field_score + confidence_score
-        return min(total_score / 100.0, 1.0)  # Normalize to 0-1
+        rates = parsing_stats.field_extraction_rates
+        avg_extraction_rate = sum(rates.values()) / len(rates) if rates else 0.0
+        return quality_score(
+            format_stats.detection_confidence,
+            parsing_stats.success_rate,
+            avg_extraction_rate,
+            parsing_stats.average_confidence,
+        )
 
     def _generate_recommendations(self, format_stats, parsing_stats, field_stats):
         recommendations = []
@@ -391,30 +513,41 @@ class LogStatsAnalyzer:
         if not format_stats or not parsing_stats:
             return ["Insufficient data for analysis"]
 
+        # A parse error type is "frequent" above this many occurrences
+        frequent_error_threshold = parsing_stats.total_lines * FREQUENT_ERROR_SHARE
+
         # Detection confidence recommendations
-        if format_stats.detection_confidence < 0.7:
+        if format_stats.detection_confidence < LOW_DETECTION_CONFIDENCE:
             recommendations.append(
                 "Low format detection confidence - consider manual format specification"
             )
 
         # Parsing success recommendations
-        if parsing_stats.success_rate < 0.8:
+        if parsing_stats.success_rate < LOW_SUCCESS_RATE:
             recommendations.append(
                 "Low parsing success rate - review malformed lines and adjust parsing rules"
             )
 
-        # Field extraction recommendations
-        poor_fields = [f for f in field_stats if f.extraction_rate < 0.5]
+        # Field extraction and null rate recommendations; only the first
+        # three of each are named, so stop once both lists are full
+        poor_fields = []
+        high_null_fields = []
+        for f in field_stats:
+            if len(poor_fields) < 3 and f.extraction_rate < POOR_EXTRACTION_RATE:
+                poor_fields.append(f)
+            if len(high_null_fields) < 3 and f.null_rate > HIGH_NULL_RATE:
+                high_null_fields.append(f)
+            if len(poor_fields) >= 3 and len(high_null_fields) >= 3:
+                break
+
         if poor_fields:
             recommendations.append(
-                f"Poor extraction for fields: {', '.join(f.name for f in poor_fields[:3])}"
+                f"Poor extraction for fields: {', '.join(f.name for f in poor_fields)}"
             )
 
-        # High null rate recommendations
-        high_null_fields = [f for f in field_stats if f.null_rate > 0.3]
         if high_null_fields:
             recommendations.append(
-                f"High null rates in fields: {', '.join(f.name for f in high_null_fields[:3])}"
+                f"High null rates in fields: {', '.join(f.name for f in high_null_fields)}"
             )
 
         # Schema recommendations
@@ -430,49 +563,100 @@ class LogStatsAnalyzer:
 
         # Error pattern recommendations
         if parsing_stats.error_distribution:
-            most_common_error = max(
-                parsing_stats.error_distribution.items(), key=lambda x: x[1]
-            )
-            if most_common_error[1] > parsing_stats.total_lines * 0.1:
+            error_distribution = parsing_stats.error_distribution
+            most_common_error = max(error_distribution, key=error_distribution.get)
+            if error_distribution[most_common_error] > frequent_error_threshold:
                 recommendations.append(
-                    f"Frequent {most_common_error[0]} errors - review log format consistency"
+                    f"Frequent {most_common_error} errors - review log format consistency"
                 )
 
         return recommendations[:5]  # Limit to top 5 recommendations
 
 
+def analyze_one(filepath):
+    """Detect, parse and analyze one log file; returns (filepath, LogInsights).
+
+    Module-level so it can run in a worker process. Only the path is sent
+    to the worker and only the insights come back: detection and parsing
+    are the expensive steps, and pickling every parsed entry to a worker
+    would cost more than the analyze() call it would save.
+    """
+    detection_result = LogSchemaInferenceEngine().analyze_file(filepath)
+    parse_result = LogParsingEngine().parse_file(filepath, detection_result)
+
+    analyzer = LogStatsAnalyzer()
+    analyzer.add_detection_result(detection_result)
+    analyzer.add_parse_result(parse_result)
+    return filepath, analyzer.analyze()
+
+
 class MultiFileStatsAggregator:
 
     def __init__(self):
         self.file_insights = {}
-        self.global_stats = defaultdict(list)
+        self.global_stats = {
+            "quality_scores": StatCounter(),
+            "detection_confidences": StatCounter(),
+            "success_rates": StatCounter(),
+            "formats": Counter(),
+        }
+        self._quality_buckets = {"excellent": 0, "good": 0, "fair": 0, "poor": 0}
+        self._field_index = {}
+        self._global_insights = None
 
     def add_file_analysis(self, filename, insights):
         self.file_insights[filename] = insights
+        self._global_insights = None
+        self._field_index[filename] = {fs.name: fs for fs in insights.field_stats}
 
-        # Aggregate global statistics
-        self.global_stats["quality_scores"].append(insights.quality_score)
-        self.global_stats["detection_confidences"].append(
+        # Aggregate global statistics as files arrive
+        self.global_stats["quality_scores"].add(insights.quality_score)
+        self.global_stats["detection_confidences"].add(
             insights.format_stats.detection_confidence
         )
-        self.global_stats["success_rates"].append(insights.parsing_stats.success_rate)
-        self.global_stats["formats"].append(insights.format_stats.format_type)
+        self.global_stats["success_rates"].add(insights.parsing_stats.success_rate)
+        self.global_stats["formats"][insights.format_stats.format_type] += 1
+
+        # Quality buckets: excellent >= 0.9 > good >= 0.7 > fair >= 0.5 > poor
+        quality_score = insights.quality_score
+        if quality_score >= 0.9:
+            self._quality_buckets["excellent"] += 1
+        elif quality_score >= 0.7:
+            self._quality_buckets["good"] += 1
+        elif quality_score >= 0.5:
+            self._quality_buckets["fair"] += 1
+        elif quality_score < 0.5:
+            self._quality_buckets["poor"] += 1
+
+    def add_files_parallel(self, filepaths, max_workers=None):
+        """Detect, parse and analyze log files in worker processes.
+
+        Results are added in input order, keyed by path, exactly as serial
+        add_file_analysis calls would.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for filepath, insights in executor.map(analyze_one, filepaths):
+                self.add_file_analysis(filepath, insights)
 
     def get_global_insights(self):
         if not self.file_insights:
             return {}
 
+        # Cleared by add_file_analysis
+        if self._global_insights is None:
+            self._global_insights = self._compute_global_insights()
+        return self._global_insights
+
+    def _compute_global_insights(self):
         total_files = len(self.file_insights)
 
         # Format distribution
-        format_distribution = Counter(self.global_stats["formats"])
+        format_distribution = self.global_stats["formats"]
 
         # Quality metrics
-        avg_quality = statistics.mean(self.global_stats["quality_scores"])
-        avg_detection_confidence = statistics.mean(
-            self.global_stats["detection_confidences"]
-        )
-        avg_success_rate = statistics.mean(self.global_stats["success_rates"])
+        avg_quality = self.global_stats["quality_scores"].mean
+        avg_detection_confidence = self.global_stats["detection_confidences"].mean
+        avg_success_rate = self.global_stats["success_rates"].mean
 
         # Problem files identification
         problem_files = []
@@ -493,18 +677,7 @@ class MultiFileStatsAggregator:
             "average_detection_confidence": avg_detection_confidence,
             "average_success_rate": avg_success_rate,
             "problem_files": sorted(problem_files, key=lambda x: x["quality_score"]),
-            "quality_distribution": {
-                "excellent": sum(
-                    1 for s in self.global_stats["quality_scores"] if s >= 0.9
-                ),
-                "good": sum(
-                    1 for s in self.global_stats["quality_scores"] if 0.7 <= s < 0.9
-                ),
-                "fair": sum(
-                    1 for s in self.global_stats["quality_scores"] if 0.5 <= s < 0.7
-                ),
-                "poor": sum(1 for s in self.global_stats["quality_scores"] if s < 0.5),
-            },
+            "quality_distribution": dict(self._quality_buckets),
         }
 
     def get_comparative_analysis(self):
@@ -513,27 +686,23 @@ class MultiFileStatsAggregator:
 
         # Compare field extraction rates across files
         all_fields = set()
-        for insights in self.file_insights.values():
-            all_fields.update(field.name for field in insights.field_stats)
+        for file_fields in self._field_index.values():
+            all_fields.update(file_fields)
 
         field_comparisons = {}
         for field_name in all_fields:
             extraction_rates = []
-            for filename, insights in self.file_insights.items():
-                field_stat = next(
-                    (f for f in insights.field_stats if f.name == field_name), None
-                )
+            for filename, file_fields in self._field_index.items():
+                field_stat = file_fields.get(field_name)
                 if field_stat:
                     extraction_rates.append((filename, field_stat.extraction_rate))
 
             if len(extraction_rates) > 1:
                 field_comparisons[field_name] = {
                     "rates": extraction_rates,
-                    "variance": (
-                        statistics.variance([rate for _, rate in extraction_rates])
-                        if len(extraction_rates) > 1
-                        else 0
-                    ),
+                    "variance": StatCounter(
+                        rate for _, rate in extraction_rates
+                    ).variance,
                     "best_file": max(extraction_rates, key=lambda x: x[1])[0],
                     "worst_file": min(extraction_rates, key=lambda x: x[1])[0],
                 }
@@ -542,9 +711,9 @@ class MultiFileStatsAggregator:
             "field_extraction_variance": field_comparisons,
             "consistency_score": (
                 1.0
-                - statistics.mean(
-                    [comp["variance"] for comp in field_comparisons.values()]
-                )
+                - StatCounter(
+                    comp["variance"] for comp in field_comparisons.values()
+                ).mean
                 if field_comparisons
                 else 1.0
             ),
@@ -76,6 +76,25 @@ def test_text_search(search_engine):
     )
 
 
+def test_text_search_partial_tokens(search_engine):
+    query = SearchQuery(text="rror: datab")
+    result = search_engine.search(query)
+    assert result.total_matches == 1
+    assert result.entries[0].raw_line == "ERROR: Database connection failed"
+
+    query = SearchQuery(text="ound")
+    result = search_engine.search(query)
+    assert result.total_matches == 1
+
+
+def test_multi_text_search(search_engine):
+    results = search_engine.multi_text_search(["error", "ERROR", "memory", "missing"])
+    assert results["error"] == [0, 3]
+    assert results["ERROR"] == [0, 3]
+    assert results["memory"] == [2]
+    assert results["missing"] == []
+
+
 def test_field_equals_filter(search_engine):
     filter_obj = SearchFilter("level", "error", "equals")
     query = SearchQuery(filters=[filter_obj])
@@ -100,6 +119,13 @@ def test_regex_filter(search_engine):
     assert all(entry.fields["status"] in ["404", "500"] for entry in result.entries)
 
 
+def test_modified_filter_is_recompiled(search_engine):
+    filter_obj = SearchFilter("status", "^[45]", "regex")
+    filter_obj.value = "^2"
+    result = search_engine.search(SearchQuery(filters=[filter_obj]))
+    assert result.total_matches == 2
+
+
 def test_numeric_filters(search_engine):
     filter_obj = SearchFilter("status", "300", "gt")
     query = SearchQuery(filters=[filter_obj])
@@ -147,6 +173,7 @@ def test_pagination(search_engine):
     query = SearchQuery(limit=2, offset=2)
     result = search_engine.search(query)
     assert len(result.entries) == 2
+    assert result.ids == [2, 3]
 
 
 def test_case_sensitivity(search_engine):
@@ -160,6 +187,38 @@ def test_case_sensitivity(search_engine):
     result = search_engine.search(query)
     assert result.total_matches == 1
 
+    filter_obj = SearchFilter("message", "Database", "contains", case_sensitive=True)
+    query = SearchQuery(filters=[filter_obj])
+    result = search_engine.search(query)
+    assert result.total_matches == 1
+
+    filter_obj = SearchFilter("message", "^High", "regex", case_sensitive=True)
+    query = SearchQuery(filters=[filter_obj])
+    result = search_engine.search(query)
+    assert result.total_matches == 1
+    assert result.entries[0].fields["message"] == "High memory usage"
+
+
+@pytest.mark.parametrize(
+    "pattern, expected_ids",
+    [
+        (r"^\D+$", [1, 2, 3, 4]),
+        (r"\W", [4]),
+        (r"^\d+$", [0]),
+    ],
+)
+def test_case_insensitive_regex_keeps_escape_case(pattern, expected_ids):
+    engine = LogSearchEngine()
+    engine.index_entries(
+        [
+            MockLogEntry(fields={"value": value}, raw_line=value)
+            for value in ["123", "abc", "ABC", "Straße", "a b"]
+        ]
+    )
+    filter_obj = SearchFilter("value", pattern, "regex", case_sensitive=False)
+    result = engine.search(SearchQuery(filters=[filter_obj]))
+    assert result.ids == expected_ids
+
 
 def test_query_builder(search_engine):
     query = QueryBuilder.simple_text("error")
@@ -179,6 +238,18 @@ def test_query_builder(search_engine):
     assert result.total_matches == 2
 
 
+def test_repeated_query_uses_cache(search_engine, sample_entries):
+    query = SearchQuery(text="error")
+    first = search_engine.search(query)
+    second = search_engine.search(SearchQuery(text="error"))
+    assert second.entries == first.entries
+    assert second.total_matches == 2
+
+    search_engine.index_entries(sample_entries[:1])
+    result = search_engine.search(query)
+    assert result.total_matches == 1
+
+
 def test_field_counts(search_engine):
     query = SearchQuery()
     result = search_engine.search(query)
@@ -187,6 +258,25 @@ def test_field_counts(search_engine):
     assert result.field_counts["level"]["info"] == 1
 
 
+def test_field_counts_keep_equal_hashing_values_apart():
+    values = [1, True, 1.0, 0, False, "1"]
+    engine = LogSearchEngine()
+    engine.index_entries(
+        [
+            MockLogEntry(fields={"flag": value}, raw_line=f"flag={value}")
+            for value in values
+        ]
+    )
+    result = engine.search(SearchQuery())
+    assert result.field_counts["flag"] == {
+        "1": 2,
+        "True": 1,
+        "1.0": 1,
+        "0": 1,
+        "False": 1,
+    }
+
+
 def test_empty_search(search_engine):
     query = SearchQuery(text="nonexistent")
     result = search_engine.search(query)
@@ -198,6 +288,7 @@ def test_helper_functions(search_engine):
 
     errors = search_errors(search_engine)
     assert len(errors) == 2
+    assert errors == [search_engine.entries[0], search_engine.entries[3]]
 
     search_engine.entries[0].fields["client_ip"] = "192.168.1.1"
     results = search_by_ip(search_engine, "192.168.1.1")
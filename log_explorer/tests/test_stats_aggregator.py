@@ -0,0 +1,47 @@
+import pytest
+from log_explorer.inference.inference_engine import LogSchemaInferenceEngine
+from log_explorer.parser.parsing_engine import LogParsingEngine
+from log_explorer.stats.analyzer import LogStatsAnalyzer, MultiFileStatsAggregator
+
+
+@pytest.fixture
+def log_files(tmp_path):
+    app_log = tmp_path / "app.log"
+    app_log.write_text(
+        "\n".join(
+            f"2024-01-15 10:{minute:02d}:00 {level} Request {minute} handled"
+            for minute, level in enumerate(["INFO", "ERROR", "WARNING", "INFO"] * 5)
+        )
+        + "\n"
+    )
+    json_log = tmp_path / "events.json"
+    json_log.write_text(
+        "\n".join(
+            f'{{"ts": "2024-01-15T11:{minute:02d}:00", "level": "info", "user": {minute % 3}}}'
+            for minute in range(20)
+        )
+        + "\n"
+    )
+    return [str(app_log), str(json_log)]
+
+
+def test_add_files_parallel_matches_serial(log_files):
+    serial = MultiFileStatsAggregator()
+    for filepath in log_files:
+        detection_result = LogSchemaInferenceEngine().analyze_file(filepath)
+        parse_result = LogParsingEngine().parse_file(filepath, detection_result)
+        analyzer = LogStatsAnalyzer()
+        analyzer.add_detection_result(detection_result)
+        analyzer.add_parse_result(parse_result)
+        serial.add_file_analysis(filepath, analyzer.analyze())
+
+    parallel = MultiFileStatsAggregator()
+    parallel.add_files_parallel(log_files, max_workers=1)
+
+    assert list(parallel.file_insights) == log_files
+    assert all(
+        insights.parsing_stats.total_lines == 20
+        for insights in parallel.file_insights.values()
+    )
+    assert parallel.file_insights == serial.file_insights
+    assert parallel.get_global_insights() == serial.get_global_insights()
@@ -75,3 +75,15 @@ def test_no_match_returns_none():
     text = "completely random string"
     assert TimestampDetector.get_best_timestamp(text) is None
     assert TimestampDetector.extract_all_timestamps(text) == []
+
+
+def test_extract_all_bulk_matches_single():
+    texts = [
+        "Start: 2023-07-27T10:00:00Z",
+        "completely random string",
+        "Start: 2023-07-27T10:00:00Z",
+        "Logged: 1689871234",
+    ]
+    results = TimestampDetector.extract_all_timestamps_bulk(texts)
+    assert results == [TimestampDetector.extract_all_timestamps(t) for t in texts]
+    assert results[0] is not results[2]
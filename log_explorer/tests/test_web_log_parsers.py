@@ -0,0 +1,71 @@
+import re
+
+import pytest
+from log_explorer.inference.line_patterns import LogPattern
+from log_explorer.inference.log_core import FieldInfo, FormatDetectionResult, LogFormat
+from log_explorer.parser.web_log_parsers import WebLogParser
+
+
+@pytest.fixture
+def apache_parser():
+    field_names = [
+        "remote_host",
+        "remote_user",
+        "timestamp",
+        "request",
+        "method",
+        "path",
+        "protocol",
+        "status",
+        "bytes_sent",
+    ]
+    detection_result = FormatDetectionResult(
+        format_type=LogFormat.APACHE_COMMON,
+        confidence=1.0,
+        schema={name: FieldInfo(name=name, data_type="string") for name in field_names},
+    )
+    return WebLogParser(detection_result)
+
+
+@pytest.mark.parametrize(
+    "request_line, expected",
+    [
+        ("GET /index.html HTTP/1.1", ("GET", "/index.html", "HTTP/1.1")),
+        ("GET  /dbl HTTP/1.1", ("GET", "/dbl", "HTTP/1.1")),
+        ("GET\t/tab\tHTTP/1.1", ("GET", "/tab", "HTTP/1.1")),
+        (" GET /x", ("GET", "/x", None)),
+        ("GET /x HTTP/1.1 ", ("GET", "/x", "HTTP/1.1")),
+        ("GET /x HTTP/1.1 extra", ("GET", "/x", "HTTP/1.1")),
+        ("GET ", (None, None, None)),
+        ("-", (None, None, None)),
+    ],
+)
+def test_request_field_is_split_on_whitespace(apache_parser, request_line, expected):
+    line = f'127.0.0.1 - frank [10/Oct/2020:13:55:36 -0700] "{request_line}" 200 2326'
+    entry = apache_parser.parse_line(line, 1)
+
+    assert not entry.is_malformed
+    assert (
+        entry.fields.get("method"),
+        entry.fields.get("path"),
+        entry.fields.get("protocol"),
+    ) == expected
+
+
+@pytest.mark.parametrize(
+    "regex",
+    [
+        r"^\[?(\d+)\]? (.*)",
+        r"^<*(\d+)>* (.*)",
+        r"^\[{0,1}(\d+)\]{0,1} (.*)",
+        r"^<ping>|^(\d+) (.*)",
+    ],
+)
+def test_pattern_without_required_first_character_is_tried(apache_parser, regex):
+    apache_parser.patterns = [
+        LogPattern(re.compile(regex), ["status", "remote_user"], "optional_lead")
+    ]
+    entry = apache_parser.parse_line("12 hello", 1)
+
+    assert not entry.is_malformed
+    assert entry.fields["status"] == "12"
@@ -13,7 +13,10 @@ Date: 2025-07-28
 """
 
 import curses
+import os
 import sys
+from itertools import islice
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from datetime import datetime
 
@@ -27,6 +30,100 @@ from .search.search_engine import (
 )
 from .stats.analyzer import LogStatsAnalyzer
 
+# File extensions listed in the file browser
+LOG_SUFFIXES = frozenset(
+    {".log", ".txt", ".csv", ".json", ".gz", ".bz2", ".xz", ".lzma"}
+)
+# First screen row below the header and tab bar
+CONTENT_START = 4
+# Queued keys applied before the screen is redrawn
+MAX_KEYS_PER_FRAME = 64
+# Color pairs are terminal-wide state, set up by the first BaseUI only
+_COLORS_INITIALIZED = False
+# Synchronized output (DEC mode 2026): supporting terminals hold everything
+# between these and paint it at once, others ignore the unknown mode
+SYNC_UPDATE_BEGIN = "\x1b[?2026h"
+SYNC_UPDATE_END = "\x1b[?2026l"
+
+# Help tab content, drawn top to bottom with scrolling
+HELP_TEXT = (
+    "LOG EXPLORER TUI - SINGLE FILE ANALYSIS",
+    "",
+    "WORKFLOW:",
+    "  1. FILES TAB: Navigate and load a log file",
+    "  2. Process with 'p' to analyze the file",
+    "  3. SEARCH TAB: Query and filter log entries",
+    "  4. STATS TAB: View complete analysis metrics",
+    "  5. PLOTS TAB: Visual representations of data",
+    "",
+    "GLOBAL CONTROLS:",
+    "  Tab              - Switch to next tab",
+    "  q                - Quit application",
+    "  Page Up/Down     - Scroll content",
+    "",
+    "FILES TAB:",
+    "  Up/Down          - Navigate directory",
+    "  Enter            - Enter directory or load file",
+    "  c                - Change directory (input mode)",
+    "  r                - Refresh directory listing",
+    "  p                - Process current file (full analysis)",
+    "",
+    "SEARCH TAB:",
+    "  NAVIGATION MODE:",
+    "    Shift+Tab      - Move between form fields",
+    "    Up/Down        - Move between form fields",
+    "    Enter/Type     - Start editing text fields",
+    "    Space          - Toggle boolean/cycle operator",
+    "    Backspace      - Clear current field",
+    "    Enter          - Execute search (when not editing and no text field highlighted)",
+    "                    !Highlight Operator/Case Sensitive!",
+    "  INPUT MODE:",
+    "    Type           - Edit text",
+    "    Enter          - Save and exit input mode",
+    "    Esc            - Cancel and exit input mode",
+    "    Ctrl+U         - Clear current line",
+    "  RESULTS:",
+    "    v              - Toggle raw lines view",
+    "    Page Up/Down   - Scroll search results",
+    "    F/B            - Scroll field values table",
+    "",
+    "TIME FORMAT:",
+    "  Use: YYYY-MM-DD HH:MM:SS",
+    "  Example: 2024-01-15 14:30:00",
+    "",
+    "SUPPORTED FORMATS:",
+    "  JSON, CSV, LTSV, Key-Value pairs",
+    "  Apache/Nginx access & error logs",
+    "  Syslog, Systemd Journal entries",
+    "  Python logging, Basic log formats",
+    "",
+    "COMPRESSION SUPPORT:",
+    "  .gz (gzip), .bz2 (bzip2), .xz (xz), .lzma (lzma)",
+)
+
+# Plot bars indexed by filled length: 30-wide gauges and 25-wide hour bars
+GAUGE_BARS = tuple("█" * filled + "░" * (30 - filled) for filled in range(31))
+HOUR_BARS = tuple(("█" * filled).ljust(25) for filled in range(26))
+# Quality gauge labels, padded to the bar column
+QUALITY_LABELS = {
+    label: label.ljust(15) for label in ("Overall", "Detection", "Parsing")
+}
+
+
+def _classify_help_line(line):
+    """Split a help line into (style, text, description) for drawing"""
+    if line.startswith("LOG EXPLORER"):
+        return "title", line, None
+    if line.endswith(":") and not line.startswith("  "):
+        return "section", line, None
+    if line.startswith("  ") and " - " in line:
+        key_text, description = line.split(" - ", 1)
+        return "key", key_text, description
+    return "text", line, None
+
+
+HELP_LINES = tuple(_classify_help_line(line) for line in HELP_TEXT)
+
 
 class BaseUI:
     """Base class with common UI utilities"""
@@ -36,18 +133,34 @@ class BaseUI:
         self.init_colors()
 
     def init_colors(self):
+        global _COLORS_INITIALIZED
+
         curses.curs_set(0)
-        curses.start_color()
-        curses.use_default_colors()
-
-        # Color pairs
-        curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)  # Selected
-        curses.init_pair(2, curses.COLOR_RED, -1)  # Error
-        curses.init_pair(3, curses.COLOR_GREEN, -1)  # Success
-        curses.init_pair(4, curses.COLOR_YELLOW, -1)  # Warning
-        curses.init_pair(5, curses.COLOR_BLUE, -1)  # Info
-        curses.init_pair(6, curses.COLOR_CYAN, -1)  # Highlight
-        curses.init_pair(7, curses.COLOR_MAGENTA, -1)  # Plot
+        if not _COLORS_INITIALIZED:
+            curses.start_color()
+            curses.use_default_colors()
+
+            # Color pairs
+            curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)  # Selected
+            curses.init_pair(2, curses.COLOR_RED, -1)  # Error
+            curses.init_pair(3, curses.COLOR_GREEN, -1)  # Success
+            curses.init_pair(4, curses.COLOR_YELLOW, -1)  # Warning
+            curses.init_pair(5, curses.COLOR_BLUE, -1)  # Info
+            curses.init_pair(6, curses.COLOR_CYAN, -1)  # Highlight
+            curses.init_pair(7, curses.COLOR_MAGENTA, -1)  # Plot
+            _COLORS_INITIALIZED = True
+
+        # Pair attributes, looked up once instead of in every draw loop
+        self.color_selected = curses.color_pair(1)
+        self.color_error = curses.color_pair(2)
+        self.color_success = curses.color_pair(3)
+        self.color_warning = curses.color_pair(4)
+        self.color_info = curses.color_pair(5)
+        self.color_highlight = curses.color_pair(6)
+        self.color_plot = curses.color_pair(7)
+        # Selected search form label and the input-mode marker
+        self.attr_selected = self.color_selected | curses.A_BOLD
+        self.attr_input = self.color_highlight | curses.A_BOLD
 
     def draw_centered_text(self, y, text, color=0):
         height, width = self.stdscr.getmaxyx()
@@ -61,6 +174,22 @@ class BaseUI:
 
 
 class SearchForm:
+    LABELS = {
+        "text_query": "Text Search",
+        "field_name": "Field Name",
+        "field_value": "Field Value",
+        "operator": "Operator",
+        "case_sensitive": "Case Sensitive",
+        "start_time": "Start Time",
+        "end_time": "End Time",
+        "last_hours": "Last Hours",
+        "last_minutes": "Last Minutes",
+        "limit": "Limit",
+        "offset": "Offset",
+    }
+    # Labels as drawn: "Label:" padded to the value column
+    LABEL_TEXT = {key: f"{label}:".ljust(16) for key, label in LABELS.items()}
+
     def __init__(self):
         self.fields = {
             "text_query": "",
@@ -77,6 +206,11 @@ class SearchForm:
         }
 
         self.operators = ["contains", "equals", "regex", "gt", "gte", "lt", "lte"]
+        # Space on the operator field cycles through operators in this order
+        self._operator_next = {
+            operator: self.operators[(i + 1) % len(self.operators)]
+            for i, operator in enumerate(self.operators)
+        }
         self.current_field = 0
         self.field_order = [
             "text_query",
@@ -111,6 +245,19 @@ class SearchForm:
         self.toggle_fields = {"case_sensitive"}
         self.cycle_fields = {"operator"}
 
+        # Field values the last built query came from, and that query
+        self._last_query_key = None
+        self._last_query = None
+
+    def snapshot(self):
+        """Everything that affects how the form is drawn"""
+        return (
+            self.current_field,
+            self.input_mode,
+            self.input_buffer,
+            tuple(self.fields.values()),
+        )
+
     def is_current_field_text(self):
         """Check if current field is a text input field"""
         field_key = self.field_order[self.current_field]
@@ -171,10 +318,7 @@ class SearchForm:
                 self.fields[field_key] = not self.fields[field_key]
                 return True
             elif field_key == "operator":
-                current_idx = self.operators.index(self.fields[field_key])
-                self.fields[field_key] = self.operators[
-                    (current_idx + 1) % len(self.operators)
-                ]
+                self.fields[field_key] = self._operator_next[self.fields[field_key]]
                 return True
             # For text fields, space should not do anything in navigation mode
             return True
@@ -230,7 +374,9 @@ class SearchForm:
 
         return False
 
-    def draw(self, stdscr, start_y, width, detection_result=None):
+    def draw(self, ui, start_y, width, detection_result=None):
+        """Draw the form on ui.stdscr using the ui's color attributes"""
+        stdscr = ui.stdscr
         y = start_y
 
         stdscr.addstr(y, 1, "Search Query Builder:", curses.A_BOLD)
@@ -242,7 +388,7 @@ class SearchForm:
             fields_text = "Available Fields: " + ", ".join(field_names[:8])
             if len(fields_text) > width - 5:
                 fields_text = fields_text[: width - 8] + "..."
-            stdscr.addstr(y, 1, fields_text, curses.color_pair(5))
+            stdscr.addstr(y, 1, fields_text, ui.color_info)
             y += 2
 
         # Time format help
@@ -250,7 +396,7 @@ class SearchForm:
             y,
             1,
             "Time Format: YYYY-MM-DD HH:MM:SS (e.g., 2024-01-15 14:30:00)",
-            curses.color_pair(4),
+            ui.color_warning,
         )
         y += 2
 
@@ -259,33 +405,28 @@ class SearchForm:
             if y >= start_y + 20:
                 break
 
-            # Field selection indicator
-            if i == self.current_field:
-                if self.input_mode:
-                    stdscr.addstr(y, 1, ">>> ", curses.color_pair(6) | curses.A_BOLD)
-                else:
-                    stdscr.addstr(y, 1, "->  ", curses.color_pair(1) | curses.A_BOLD)
-                label_color = curses.color_pair(1) | curses.A_BOLD
+            # Field selection indicator and label, in one write when they
+            # share an attribute
+            label = self.LABEL_TEXT[field_key]
+            if i != self.current_field:
+                stdscr.addstr(y, 1, "    " + label)
+            elif self.input_mode:
+                stdscr.addstr(y, 1, ">>> ", ui.attr_input)
+                stdscr.addstr(y, 5, label, ui.attr_selected)
             else:
-                stdscr.addstr(y, 1, "    ")
-                label_color = 0
-
-            # Field label
-            label = self._get_field_label(field_key)
-            label_formatted = f"{label}:".ljust(16)
-            stdscr.addstr(y, 5, label_formatted, label_color)
+                stdscr.addstr(y, 1, "->  " + label, ui.attr_selected)
 
             # Field value
             if self.input_mode and i == self.current_field:
                 value = self.input_buffer + "_"  # Show cursor
-                stdscr.addstr(y, 22, value, curses.color_pair(6))
+                stdscr.addstr(y, 22, value, ui.color_highlight)
             else:
                 value = self._get_field_display_value(field_key)
                 max_value_width = width - 25
                 if len(value) > max_value_width:
                     value = value[: max_value_width - 3] + "..."
 
-                color = self._get_field_color(field_key)
+                color = self._get_field_color(ui, field_key)
                 stdscr.addstr(y, 22, value, color)
 
             y += 1
@@ -305,26 +446,13 @@ class SearchForm:
 
         for instruction in instructions:
             if y < start_y + 22:
-                stdscr.addstr(y, 1, instruction[: width - 2], curses.color_pair(4))
+                stdscr.addstr(y, 1, instruction[: width - 2], ui.color_warning)
                 y += 1
 
         return y
 
     def _get_field_label(self, field_key):
-        labels = {
-            "text_query": "Text Search",
-            "field_name": "Field Name",
-            "field_value": "Field Value",
-            "operator": "Operator",
-            "case_sensitive": "Case Sensitive",
-            "start_time": "Start Time",
-            "end_time": "End Time",
-            "last_hours": "Last Hours",
-            "last_minutes": "Last Minutes",
-            "limit": "Limit",
-            "offset": "Offset",
-        }
-        return labels.get(field_key, field_key)
+        return self.LABELS.get(field_key, field_key)
 
     def _get_field_display_value(self, field_key):
         value = self.fields[field_key]
@@ -338,15 +466,19 @@ class SearchForm:
         else:
             return str(value)
 
-    def _get_field_color(self, field_key):
+    def _get_field_color(self, ui, field_key):
         if field_key in self.text_fields:
-            return (
-                curses.color_pair(3) if self.fields[field_key] else curses.color_pair(4)
-            )
+            return ui.color_success if self.fields[field_key] else ui.color_warning
         else:
-            return curses.color_pair(3)
+            return ui.color_success
 
     def build_query(self):
+        # Relative time filters are resolved by the engine at search time,
+        # so unchanged fields always describe the same query
+        key = tuple(self.fields[field_key] for field_key in self.field_order)
+        if key == self._last_query_key:
+            return self._last_query
+
         query = SearchQuery()
 
         # Text search
@@ -372,14 +504,12 @@ class SearchForm:
             time_filter = TimeFilter()
 
             if self.fields["start_time"].strip():
-                time_filter.start_time = datetime.strptime(
-                    self.fields["start_time"].strip(), "%Y-%m-%d %H:%M:%S"
+                time_filter.start_time = self._parse_time_input(
+                    self.fields["start_time"]
                 )
 
             if self.fields["end_time"].strip():
-                time_filter.end_time = datetime.strptime(
-                    self.fields["end_time"].strip(), "%Y-%m-%d %H:%M:%S"
-                )
+                time_filter.end_time = self._parse_time_input(self.fields["end_time"])
 
         elif self.fields["last_hours"].strip():
             hours = int(self.fields["last_hours"].strip())
@@ -397,8 +527,26 @@ class SearchForm:
         if self.fields["offset"].strip():
             query.offset = int(self.fields["offset"].strip())
 
+        self._last_query_key = key
+        self._last_query = query
         return query
 
+    @staticmethod
+    def _parse_time_input(value):
+        """Parse a YYYY-MM-DD HH:MM:SS form value into a naive datetime"""
+        value = value.strip()
+        # fromisoformat is much faster than strptime but accepts more shapes
+        # (dates only, offsets, fractions), so only trust it on exact matches
+        if len(value) == 19 and value[10] == " ":
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                pass
+            else:
+                if parsed.tzinfo is None:
+                    return parsed
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
 
 class ScrollableContent:
     """Mixin for scrollable content management"""
@@ -426,6 +574,38 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
 
         self.current_tab = 0
         self.tabs = ["Files", "Search", "Stats", "Plots", "Help"]
+        # Draw method per tab, in the same order as self.tabs
+        self._tab_handlers = (
+            self.draw_files_tab,
+            self.draw_search_tab,
+            self.draw_stats_tab,
+            self.draw_plots_tab,
+            self.draw_help_tab,
+        )
+        # Global key handlers, checked before the current tab's handler
+        self._global_key_handlers = {
+            ord("q"): self._handle_quit_key,
+            27: self._handle_escape_key,  # ESC
+            ord("\t"): self._handle_tab_key,
+            curses.KEY_BTAB: self._handle_back_tab_key,
+            curses.KEY_PPAGE: self._handle_scroll,
+            curses.KEY_NPAGE: self._handle_scroll,
+        }
+        # Input handler per tab, in the same order as self.tabs
+        self._tab_input_handlers = (
+            self._handle_files_input,
+            self._handle_search_input,
+            self._handle_scroll_only_input,  # Stats
+            self._handle_scroll_only_input,  # Plots
+            self._handle_scroll_only_input,  # Help
+        )
+        # Attribute per HELP_LINES style (color pairs exist only after init)
+        self._help_styles = {
+            "title": curses.A_BOLD | self.color_highlight,
+            "section": curses.A_UNDERLINE | self.color_info,
+            "key": self.color_highlight,
+            "text": 0,
+        }
 
         # Initialize engines
         self.inference_engine = LogSchemaInferenceEngine()
@@ -438,15 +618,30 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
         self.detection_result = None
         self.parse_result = None
         self.insights = None
+        # (insights, stats tab lines built from them)
+        self._stats_cache = (None, None)
+        # (insights, (rate rows, hour bars, component scores)) for the plots tab
+        self._plots_cache = (None, None)
 
         # Search state
         self.search_results = None
         self.search_form = SearchForm()
         self.show_raw_lines = False
+        # (search_results, sorted field names) for the parsed-fields table
+        self._field_names_cache = (None, None)
+        # (search_results, top (field, value, count) pairs) for field counts
+        self._field_pairs_cache = (None, None)
+        # (search_results, layout key, formatted row per entry)
+        self._rendered_rows = (None, None, None)
 
         # UI state
         self.status_message = ""
         self.error_message = ""
+        # Set by input handlers that change what is on screen
+        self._dirty = True
+        # ((tab, file, input mode), default status bar text)
+        self._status_cache = (None, None)
+        self._recompute_layout()
 
         # File browser state
         self.current_dir = Path.cwd()
@@ -460,19 +655,14 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
             if self.current_dir.parent != self.current_dir:
                 self.dir_contents.append(("..", True))
 
-            for item in sorted(self.current_dir.iterdir()):
+            # scandir entries carry their file type, so is_dir() needs no
+            # extra stat call per item
+            with os.scandir(self.current_dir) as items:
+                items = sorted(items, key=attrgetter("name"))
+            for item in items:
                 if item.is_dir():
                     self.dir_contents.append((item.name, True))
-                elif item.suffix.lower() in [
-                    ".log",
-                    ".txt",
-                    ".csv",
-                    ".json",
-                    ".gz",
-                    ".bz2",
-                    ".xz",
-                    ".lzma",
-                ]:
+                elif os.path.splitext(item.name)[1].lower() in LOG_SUFFIXES:
                     self.dir_contents.append((item.name, False))
         except PermissionError:
             self.error_message = f"Permission denied: {self.current_dir}"
@@ -480,18 +670,54 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
     def run(self):
         while True:
             try:
-                self.draw()
+                if self._dirty:
+                    self._dirty = False
+                    self.draw()
                 key = self.stdscr.getch()
-                if not self.handle_input(key):
-                    break
+                # Apply keys that queued up meanwhile (e.g. a held arrow key)
+                # before drawing again, so a burst costs a single repaint
+                handled = 0
+                while key != -1:
+                    if key == curses.KEY_RESIZE:
+                        self._recompute_layout()
+                        self._dirty = True
+                    elif not self.handle_input(key):
+                        return
+                    handled += 1
+                    key = self._poll_key() if handled < MAX_KEYS_PER_FRAME else -1
             except KeyboardInterrupt:
                 break
             except Exception as e:
                 self.error_message = f"Error: {str(e)}"
+                self._dirty = True
+
+    def _poll_key(self):
+        """Return the next queued key, or -1 without waiting for one"""
+        # Only this read is non-blocking; handlers such as the directory
+        # prompt still need getch/getstr to wait for input
+        self.stdscr.nodelay(True)
+        try:
+            return self.stdscr.getch()
+        finally:
+            self.stdscr.nodelay(False)
+
+    def scroll(self, content_type, delta, max_items=None):
+        previous = self.scroll_positions.get(content_type, 0)
+        new_pos = ScrollableContent.scroll(self, content_type, delta, max_items)
+        if new_pos != previous:
+            self._dirty = True
+        return new_pos
+
+    def _recompute_layout(self):
+        """Cache the terminal size; only changes on KEY_RESIZE"""
+        self._height, self._width = self.stdscr.getmaxyx()
+        self._content_height = self._height - CONTENT_START - 2
 
     def draw(self):
-        self.stdscr.clear()
-        height, width = self.stdscr.getmaxyx()
+        # erase() only blanks the virtual screen, so refresh sends just the
+        # cells that changed; clear() would force a full repaint every frame
+        self.stdscr.erase()
+        width = self._width
 
         # Draw header
         self.draw_header(width)
@@ -499,26 +725,18 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
         # Draw tabs
         self.draw_tabs(width)
 
-        # Draw main content
-        content_start = 4
-        content_height = height - content_start - 2
-
         # Tab content dispatch
-        tab_handlers = {
-            0: self.draw_files_tab,
-            1: self.draw_search_tab,
-            2: self.draw_stats_tab,
-            3: self.draw_plots_tab,
-            4: self.draw_help_tab,
-        }
-
-        handler = tab_handlers.get(self.current_tab)
-        if handler:
-            handler(content_start, content_height, width)
+        self._tab_handlers[self.current_tab](CONTENT_START, self._content_height, width)
 
         # Draw status bar
-        self.draw_status_bar(height - 1, width)
-        self.stdscr.refresh()
+        self.draw_status_bar(self._height - 1, width)
+        self.stdscr.noutrefresh()
+        # doupdate() flushes its own output, so the markers bracket the frame
+        sys.stdout.write(SYNC_UPDATE_BEGIN)
+        sys.stdout.flush()
+        curses.doupdate()
+        sys.stdout.write(SYNC_UPDATE_END)
+        sys.stdout.flush()
 
     def draw_header(self, width):
         title = "Log Explorer TUI - Single File Analysis"
@@ -527,17 +745,24 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
         # Current file info
         if self.current_file:
             file_info = f"File: {self.current_file}"
-            self.draw_truncated_text(1, 1, file_info, width - 2, curses.color_pair(5))
+            self.draw_truncated_text(1, 1, file_info, width - 2, self.color_info)
 
     def draw_tabs(self, width):
+        # Write the whole tab row at once, then highlight the current tab
         y = 2
         x = 1
+        labels = []
         for i, tab in enumerate(self.tabs):
             if i == self.current_tab:
-                self.stdscr.addstr(y, x, f"[{tab}]", curses.color_pair(1))
+                labels.append(f"[{tab}]")
+                current_x = x
             else:
-                self.stdscr.addstr(y, x, f" {tab} ")
+                labels.append(f" {tab} ")
             x += len(tab) + 4
+        self.stdscr.addstr(y, 1, "  ".join(labels))
+        self.stdscr.chgat(
+            y, current_x, len(self.tabs[self.current_tab]) + 2, self.color_selected
+        )
 
     def draw_files_tab(self, start_y, height, width):
         y = start_y
@@ -551,10 +776,9 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
         y += 1
 
         scroll_pos = self.scroll_positions["files"]
-        for i, (name, is_dir) in enumerate(self.dir_contents[scroll_pos:]):
-            if y >= start_y + height - 8:
-                break
-
+        visible_rows = max(0, start_y + height - 8 - y)
+        visible = self.dir_contents[scroll_pos : scroll_pos + visible_rows]
+        for i, (name, is_dir) in enumerate(visible):
             prefix = "[DIR] " if is_dir else "[FILE] "
             display_name = name
             max_name_width = width - len(prefix) - 5
@@ -564,9 +788,9 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
 
             # Highlight current selection
             if i + scroll_pos == scroll_pos:
-                color = curses.color_pair(1)
+                color = self.color_selected
             else:
-                color = curses.color_pair(6) if is_dir else 0
+                color = self.color_highlight if is_dir else 0
 
             self.stdscr.addstr(y, 3, prefix + display_name, color)
             y += 1
@@ -603,7 +827,7 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
             for item in status_items:
                 if y >= start_y + height - 4:
                     break
-                self.stdscr.addstr(y, 3, item, curses.color_pair(3))
+                self.stdscr.addstr(y, 3, item, self.color_success)
                 y += 1
 
         # Instructions
@@ -615,7 +839,7 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
         y = start_y + height - len(instructions) - 1
         for instruction in instructions:
             if y < start_y + height:
-                self.stdscr.addstr(y, 1, instruction, curses.color_pair(4))
+                self.stdscr.addstr(y, 1, instruction, self.color_warning)
                 y += 1
 
     def draw_search_tab(self, start_y, height, width):
@@ -626,21 +850,19 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
                 y,
                 1,
                 "No file loaded. Go to Files tab and load a file.",
-                curses.color_pair(2),
+                self.color_error,
             )
             return
 
         # Search form
-        form_height = self.search_form.draw(
-            self.stdscr, y, width, self.detection_result
-        )
+        form_height = self.search_form.draw(self, y, width, self.detection_result)
         y = form_height + 1
 
         # Only show toggle and results if not in input mode
         if not self.search_form.input_mode:
             # Toggle raw lines view
             toggle_text = f"View: {'Raw Lines' if self.show_raw_lines else 'Parsed Fields'} (press 'v' to toggle)"
-            self.stdscr.addstr(y, 1, toggle_text, curses.color_pair(6))
+            self.stdscr.addstr(y, 1, toggle_text, self.color_highlight)
             y += 2
 
         # Search results
@@ -678,14 +900,10 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
             y, 1, "Field Name".ljust(20) + "Value".ljust(25) + "Count", curses.A_BOLD
         )
         y += 1
-        self.stdscr.addstr(y, 1, "-" * 50, curses.color_pair(5))
+        self.stdscr.addstr(y, 1, "-" * 50, self.color_info)
         y += 1
 
-        # Prepare field value pairs
-        field_value_pairs = []
-        for field_name, value_counts in self.search_results.field_counts.items():
-            for value, count in list(value_counts.items())[:3]:  # Top 3 per field
-                field_value_pairs.append((field_name, str(value), count))
+        field_value_pairs = self._field_value_pairs()
 
         # Display with scrolling
         scroll_pos = self.scroll_positions["field_values"]
@@ -702,19 +920,31 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
             value_display = value[:24].ljust(25)
             count_display = str(count)
 
-            self.stdscr.addstr(y, 1, field_display, curses.color_pair(5))
+            self.stdscr.addstr(y, 1, field_display, self.color_info)
             self.stdscr.addstr(y, 21, value_display)
-            self.stdscr.addstr(y, 46, count_display, curses.color_pair(3))
+            self.stdscr.addstr(y, 46, count_display, self.color_success)
             y += 1
 
         if len(field_value_pairs) > 5:
             nav_text = f"Showing {scroll_pos+1}-{scroll_pos+display_count} of {len(field_value_pairs)} (F/B: scroll field values)"
-            self.stdscr.addstr(y, 1, nav_text, curses.color_pair(4))
+            self.stdscr.addstr(y, 1, nav_text, self.color_warning)
             y += 1
         y += 1
 
         return y
 
+    def _field_value_pairs(self):
+        """Top 3 (field, value, count) pairs per field of the current results"""
+        cached_results, pairs = self._field_pairs_cache
+        if cached_results is not self.search_results:
+            pairs = [
+                (field_name, str(value), count)
+                for field_name, value_counts in self.search_results.field_counts.items()
+                for value, count in islice(value_counts.items(), 3)
+            ]
+            self._field_pairs_cache = (self.search_results, pairs)
+        return pairs
+
     def _draw_results_table(self, y, start_y, height, width):
         """Draw the main results table"""
         self.stdscr.addstr(y, 1, "Search Results:", curses.A_UNDERLINE)
@@ -733,7 +963,7 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
             display_start = scroll_pos + 1
             display_end = min(scroll_pos + 10, total_entries)
             nav_text = f"Results: {display_start}-{display_end} of {total_entries} (PgUp/PgDn: scroll results)"
-            self.stdscr.addstr(y, 1, nav_text, curses.color_pair(4))
+            self.stdscr.addstr(y, 1, nav_text, self.color_warning)
             y += 1
 
         return y
@@ -743,37 +973,60 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
         # Header
         self.stdscr.addstr(y, 1, "#".ljust(6) + "Raw Line", curses.A_BOLD)
         y += 1
-        self.stdscr.addstr(y, 1, "-" * (width - 2), curses.color_pair(5))
+        self.stdscr.addstr(y, 1, "-" * (width - 2), self.color_info)
         y += 1
 
         # Lines
-        for i, entry in enumerate(self.search_results.entries[scroll_pos:]):
-            if y >= start_y + height - 4:
-                break
-
-            raw_line = getattr(entry, "raw_line", str(entry))
-            line_num = str(i + scroll_pos + 1).ljust(6)
-
-            # Truncate long lines
-            max_line_length = width - 8
-            if len(raw_line) > max_line_length:
-                raw_line = raw_line[: max_line_length - 3] + "..."
-
-            self.stdscr.addstr(y, 1, line_num, curses.color_pair(6))
+        rows = self._cached_rows(width)
+        visible_rows = max(0, start_y + height - 4 - y)
+        visible = self.search_results.entries[scroll_pos : scroll_pos + visible_rows]
+        for i, entry in enumerate(visible):
+            index = i + scroll_pos
+            row = rows[index]
+            if row is None:
+                row = rows[index] = self._format_raw_row(index, entry, width)
+            line_num, raw_line = row
+
+            self.stdscr.addstr(y, 1, line_num, self.color_highlight)
             self.stdscr.addstr(y, 7, raw_line)
             y += 1
 
         return y
 
+    def _cached_rows(self, width, display_fields=None):
+        """Formatted rows for the current results, filled in as they are shown"""
+        key = (width, self.show_raw_lines, display_fields)
+        results, cached_key, rows = self._rendered_rows
+        if results is not self.search_results or cached_key != key:
+            rows = [None] * len(self.search_results.entries)
+            self._rendered_rows = (self.search_results, key, rows)
+        return rows
+
+    def _format_raw_row(self, index, entry, width):
+        raw_line = getattr(entry, "raw_line", str(entry))
+        line_num = str(index + 1).ljust(6)
+
+        # Truncate long lines
+        max_line_length = width - 8
+        if len(raw_line) > max_line_length:
+            raw_line = raw_line[: max_line_length - 3] + "..."
+
+        return line_num, raw_line
+
     def _draw_parsed_fields_table(self, y, start_y, height, width, scroll_pos):
         """Draw parsed fields table"""
-        # Get field names for headers
-        all_field_names = set()
-        for entry in self.search_results.entries:
-            if hasattr(entry, "fields") and entry.fields:
-                all_field_names.update(entry.fields.keys())
-
-        field_names = sorted(list(all_field_names))
+        # Get field names for headers, once per result set
+        cached_results, field_names = self._field_names_cache
+        if cached_results is not self.search_results:
+            field_names = sorted(
+                {
+                    field_name
+                    for entry in self.search_results.entries
+                    if getattr(entry, "fields", None)
+                    for field_name in entry.fields
+                }
+            )
+            self._field_names_cache = (self.search_results, field_names)
         max_fields = min(len(field_names), (width - 20) // 15)
         display_fields = field_names[:max_fields]
 
@@ -784,82 +1037,97 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
             field_width = max(8, remaining_width // len(display_fields))
             for field in display_fields:
                 col_widths[field] = min(field_width, 20)
+        # One left-aligned %-conversion per column, shared by header and rows
+        row_format = "".join(
+            "%%-%ds" % col_widths[column] for column in ("#", "Time", *display_fields)
+        )
 
         # Header
-        header_line = "#".ljust(col_widths["#"]) + "Time".ljust(col_widths["Time"])
-        for field in display_fields:
-            header_line += field[: col_widths[field] - 1].ljust(col_widths[field])
+        header_line = row_format % (
+            "#",
+            "Time",
+            *(field[: col_widths[field] - 1] for field in display_fields),
+        )
 
         self.stdscr.addstr(y, 1, header_line[: width - 2], curses.A_BOLD)
         y += 1
         self.stdscr.addstr(
-            y, 1, "-" * min(len(header_line), width - 2), curses.color_pair(5)
+            y, 1, "-" * min(len(header_line), width - 2), self.color_info
         )
         y += 1
 
         # Entries
-        for i, entry in enumerate(self.search_results.entries[scroll_pos:]):
-            if y >= start_y + height - 4:
-                break
-
-            # Build line content
-            entry_num = str(i + scroll_pos + 1).ljust(col_widths["#"])
-            line_content = entry_num
-
-            # Timestamp
-            if hasattr(entry, "timestamp") and entry.timestamp:
-                time_str = entry.timestamp.strftime("%m-%d %H:%M")[
-                    : col_widths["Time"] - 1
-                ].ljust(col_widths["Time"])
-            else:
-                time_str = "No Time".ljust(col_widths["Time"])
-            line_content += time_str
-
-            # Fields
-            if hasattr(entry, "fields") and entry.fields:
-                for field_name in display_fields:
-                    field_value = entry.fields.get(field_name, "")
-                    if field_value is not None:
-                        field_str = str(field_value)[
-                            : col_widths[field_name] - 1
-                        ].ljust(col_widths[field_name])
-                    else:
-                        field_str = "-".ljust(col_widths[field_name])
-                    line_content += field_str
-            else:
-                # Fill empty columns
-                for field_name in display_fields:
-                    line_content += "-".ljust(col_widths[field_name])
+        rows = self._cached_rows(width, tuple(display_fields))
+        visible_rows = max(0, start_y + height - 4 - y)
+        visible = self.search_results.entries[scroll_pos : scroll_pos + visible_rows]
+        for i, entry in enumerate(visible):
+            index = i + scroll_pos
+            line_content = rows[index]
+            if line_content is None:
+                line_content = rows[index] = self._format_parsed_row(
+                    index, entry, display_fields, col_widths, row_format, width
+                )
 
             # Display the line
-            self.stdscr.addstr(y, 1, line_content[: width - 2])
+            self.stdscr.addstr(y, 1, line_content)
             y += 1
 
         # Show field truncation info
         if len(field_names) > max_fields:
             truncated_msg = f"Showing {len(display_fields)}/{len(field_names)} fields. Hidden: {', '.join(field_names[max_fields:max_fields+3])}{'...' if len(field_names) > max_fields + 3 else ''}"
-            self.stdscr.addstr(y, 1, truncated_msg[: width - 2], curses.color_pair(4))
+            self.stdscr.addstr(y, 1, truncated_msg[: width - 2], self.color_warning)
             y += 1
 
         return y
 
+    def _format_parsed_row(
+        self, index, entry, display_fields, col_widths, row_format, width
+    ):
+        # Timestamp
+        if hasattr(entry, "timestamp") and entry.timestamp:
+            time_str = entry.timestamp.strftime("%m-%d %H:%M")[: col_widths["Time"] - 1]
+        else:
+            time_str = "No Time"
+
+        # Fields
+        if hasattr(entry, "fields") and entry.fields:
+            values = []
+            for field_name in display_fields:
+                field_value = entry.fields.get(field_name, "")
+                if field_value is not None:
+                    values.append(str(field_value)[: col_widths[field_name] - 1])
+                else:
+                    values.append("-")
+        else:
+            # Fill empty columns
+            values = ["-"] * len(display_fields)
+
+        # row_format pads every column in one pass
+        return (row_format % (index + 1, time_str, *values))[: width - 2]
+
+    def _rate_color(self, rate):
+        """Green above 80%, yellow below 50%, default color in between"""
+        if rate > 0.8:
+            return self.color_success
+        return self.color_warning if rate < 0.5 else 0
+
     def draw_stats_tab(self, start_y, height, width):
         y = start_y
 
         if not self.insights:
             self.stdscr.addstr(
-                y, 1, "No analysis data. Process file first.", curses.color_pair(2)
+                y, 1, "No analysis data. Process file first.", self.color_error
             )
             return
 
         scroll_pos = self.scroll_positions["main"]
-        content_lines = self._get_stats_content_lines()
+        if self._stats_cache[0] is not self.insights:
+            self._stats_cache = (self.insights, self._get_stats_content_lines())
+        content_lines = self._stats_cache[1]
 
         # Display content with scrolling
-        for line_data in content_lines[scroll_pos:]:
-            if y >= start_y + height - 2:
-                break
-
+        visible_rows = max(0, start_y + height - 2 - y)
+        for line_data in content_lines[scroll_pos : scroll_pos + visible_rows]:
             text, color, indent = line_data
             self.stdscr.addstr(y, 1 + indent, text[: width - 2 - indent], color)
             y += 1
@@ -870,7 +1138,7 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
 
         # Format Detection Stats
         lines.append(
-            ("═══ FORMAT DETECTION ═══", curses.A_BOLD | curses.color_pair(6), 0)
+            ("═══ FORMAT DETECTION ═══", curses.A_BOLD | self.color_highlight, 0)
         )
 
         format_stats = self.insights.format_stats
@@ -886,7 +1154,7 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
 
         for info in format_info:
             color = (
-                curses.color_pair(3)
+                self.color_success
                 if "Confidence" in info and format_stats.detection_confidence > 0.8
                 else 0
             )
@@ -896,7 +1164,7 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
 
         # Parsing Performance Stats
         lines.append(
-            ("═══ PARSING PERFORMANCE ═══", curses.A_BOLD | curses.color_pair(6), 0)
+            ("═══ PARSING PERFORMANCE ═══", curses.A_BOLD | self.color_highlight, 0)
         )
 
         parsing_stats = self.insights.parsing_stats
@@ -910,7 +1178,7 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
 
         for info in parsing_info:
             color = (
-                curses.color_pair(3)
+                self.color_success
                 if parsing_stats.success_rate > 0.8 and "Success Rate" in info
                 else 0
             )
@@ -921,25 +1189,20 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
             lines.append(("", 0, 0))
             lines.append(("Error Types:", curses.A_UNDERLINE, 1))
             for error_type, count in parsing_stats.error_distribution.items():
-                lines.append((f"{error_type}: {count:,}", curses.color_pair(2), 2))
+                lines.append((f"{error_type}: {count:,}", self.color_error, 2))
 
         # Field Extraction Rates
         if parsing_stats.field_extraction_rates:
             lines.append(("", 0, 0))
             lines.append(("Field Extraction Rates:", curses.A_UNDERLINE, 1))
             for field_name, rate in parsing_stats.field_extraction_rates.items():
-                color = (
-                    curses.color_pair(3)
-                    if rate > 0.8
-                    else curses.color_pair(4) if rate < 0.5 else 0
-                )
-                lines.append((f"{field_name}: {rate:.1%}", color, 2))
+                lines.append((f"{field_name}: {rate:.1%}", self._rate_color(rate), 2))
 
         lines.append(("", 0, 0))
 
         # Field Statistics
         lines.append(
-            ("═══ FIELD STATISTICS ═══", curses.A_BOLD | curses.color_pair(6), 0)
+            ("═══ FIELD STATISTICS ═══", curses.A_BOLD | self.color_highlight, 0)
         )
 
         for field in self.insights.field_stats:
@@ -957,20 +1220,15 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
                 f"Confidence: {field.confidence:.3f}",
             ]
 
-            for metric in metrics:
-                color = (
-                    curses.color_pair(3)
-                    if field.extraction_rate > 0.8
-                    else curses.color_pair(4) if field.extraction_rate < 0.5 else 0
-                )
-                lines.append((metric, color, 2))
+            color = self._rate_color(field.extraction_rate)
+            lines.extend((metric, color, 2) for metric in metrics)
 
             # Most common values
             if field.most_common_values:
                 common_values = ", ".join(
                     [f"{v}({c})" for v, c in field.most_common_values[:5]]
                 )
-                lines.append((f"Top Values: {common_values}", curses.color_pair(5), 2))
+                lines.append((f"Top Values: {common_values}", self.color_info, 2))
             lines.append(("", 0, 0))
 
         # Time Series Stats
@@ -978,7 +1236,7 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
             lines.append(
                 (
                     "═══ TIME SERIES ANALYSIS ═══",
-                    curses.A_BOLD | curses.color_pair(6),
+                    curses.A_BOLD | self.color_highlight,
                     0,
                 )
             )
@@ -1004,267 +1262,203 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
 
         if not self.insights:
             self.stdscr.addstr(
-                y, 1, "No analysis data. Process file first.", curses.color_pair(2)
+                y, 1, "No analysis data. Process file first.", self.color_error
             )
             return
 
+        if self._plots_cache[0] is not self.insights:
+            self._plots_cache = (self.insights, self._get_plot_bars())
+        rate_rows, hour_bars, component_scores = self._plots_cache[1]
+
         # Field Extraction Rates Bar Chart
-        if self.insights.parsing_stats.field_extraction_rates:
+        if rate_rows:
             self.stdscr.addstr(
-                y, 1, "Field Extraction Rates", curses.A_BOLD | curses.color_pair(6)
+                y, 1, "Field Extraction Rates", curses.A_BOLD | self.color_highlight
             )
             y += 1
 
-            rates = list(self.insights.parsing_stats.field_extraction_rates.items())[:8]
-            if rates:
-                max_rate = max(rate for _, rate in rates)
-                for field_name, rate in rates:
-                    if y >= start_y + height - 25:
-                        break
-
-                    bar_length = int((rate / max_rate) * 30) if max_rate > 0 else 0
-                    bar = "█" * bar_length + "░" * (30 - bar_length)
-
-                    field_display = field_name[:15].ljust(15)
-                    color = (
-                        curses.color_pair(3)
-                        if rate > 0.8
-                        else curses.color_pair(4) if rate < 0.5 else 0
-                    )
-                    self.stdscr.addstr(
-                        y, 2, f"{field_display} |{bar}| {rate:.1%}", color
-                    )
-                    y += 1
+            for text, color in rate_rows:
+                if y >= start_y + height - 25:
+                    break
+                self.stdscr.addstr(y, 2, text, color)
+                y += 1
             y += 2
 
         # Hourly Distribution Plot
-        if (
-            self.insights.time_series_stats
-            and self.insights.time_series_stats.counts_per_hour
-        ):
+        if hour_bars:
             self.stdscr.addstr(
-                y, 1, "Hourly Distribution", curses.A_BOLD | curses.color_pair(6)
+                y, 1, "Hourly Distribution", curses.A_BOLD | self.color_highlight
             )
             y += 1
 
-            hour_counts = self.insights.time_series_stats.counts_per_hour
-            if hour_counts:
-                max_count = max(hour_counts.values())
-
-                for hour in range(24):
-                    if y >= start_y + height - 15:
-                        break
-
-                    count = hour_counts.get(hour, 0)
-                    if count > 0:
-                        bar_length = (
-                            int((count / max_count) * 25) if max_count > 0 else 0
-                        )
-                        bar = "█" * bar_length
-                        self.stdscr.addstr(
-                            y,
-                            2,
-                            f"{hour:02d}:00 |{bar.ljust(25)}| {count:,}",
-                            curses.color_pair(7),
-                        )
-                        y += 1
+            for hour, count, bar_length in hour_bars:
+                if y >= start_y + height - 15:
+                    break
+
+                self.stdscr.addstr(
+                    y,
+                    2,
+                    f"{hour:02d}:00 |{HOUR_BARS[bar_length]}| {count:,}",
+                    self.color_plot,
+                )
+                y += 1
             y += 2
 
         # Quality Metrics Gauge
         quality_score = self.insights.quality_score
         self.stdscr.addstr(
-            y, 1, "Quality Score Breakdown", curses.A_BOLD | curses.color_pair(6)
+            y, 1, "Quality Score Breakdown", curses.A_BOLD | self.color_highlight
         )
         y += 1
 
         # Overall quality gauge
-        gauge_length = 30
-        filled_length = int(quality_score * gauge_length)
-        gauge = "█" * filled_length + "░" * (gauge_length - filled_length)
+        filled_length = min(max(int(quality_score * 30), 0), 30)
+        gauge = GAUGE_BARS[filled_length]
 
         color = (
-            curses.color_pair(3)
+            self.color_success
             if quality_score > 0.8
-            else curses.color_pair(4) if quality_score < 0.5 else curses.color_pair(5)
+            else self.color_warning if quality_score < 0.5 else self.color_info
         )
         self.stdscr.addstr(
-            y, 2, f"Overall".ljust(15) + f" |{gauge}| {quality_score:.3f}", color
+            y, 2, f"{QUALITY_LABELS['Overall']} |{gauge}| {quality_score:.3f}", color
         )
         y += 1
 
         # Component scores
+        for label, score in component_scores:
+            if y >= start_y + height - 3:
+                break
+            gauge = GAUGE_BARS[min(max(int(score * 30), 0), 30)]
+            self.stdscr.addstr(
+                y,
+                2,
+                f"{QUALITY_LABELS[label]} |{gauge}| {score:.3f}",
+                self._rate_color(score),
+            )
+            y += 1
+
+    def _get_plot_bars(self):
+        """Rendered rate rows, hourly bars and component scores for the plots tab"""
+        # The eight best-extracted fields; ties keep schema order
+        rates = sorted(
+            self.insights.parsing_stats.field_extraction_rates.items(),
+            key=itemgetter(1),
+            reverse=True,
+        )[:8]
+        max_rate = rates[0][1] if rates else 0
+        rate_rows = []
+        for field_name, rate in rates:
+            bar_length = int((rate / max_rate) * 30) if max_rate > 0 else 0
+            rate_rows.append(
+                (
+                    f"{field_name[:15].ljust(15)} |{GAUGE_BARS[bar_length]}| {rate:.1%}",
+                    self._rate_color(rate),
+                )
+            )
+
+        hour_bars = []
+        time_series_stats = self.insights.time_series_stats
+        if time_series_stats and time_series_stats.counts_per_hour:
+            hour_counts = time_series_stats.counts_per_hour
+            max_count = max(hour_counts.values())
+            # The analyzer keeps only hours with entries, in ascending order
+            hour_bars = [
+                (hour, count, int((count / max_count) * 25) if max_count > 0 else 0)
+                for hour, count in hour_counts.items()
+            ]
+
+        component_scores = []
         if hasattr(self.insights, "format_stats") and hasattr(
             self.insights, "parsing_stats"
         ):
-            detection_score = self.insights.format_stats.detection_confidence
-            parsing_score = self.insights.parsing_stats.success_rate
-
-            for label, score in [
-                ("Detection", detection_score),
-                ("Parsing", parsing_score),
-            ]:
-                if y >= start_y + height - 3:
-                    break
-                filled = int(score * 30)
-                gauge = "█" * filled + "░" * (30 - filled)
-                color = (
-                    curses.color_pair(3)
-                    if score > 0.8
-                    else curses.color_pair(4) if score < 0.5 else 0
-                )
-                self.stdscr.addstr(
-                    y, 2, f"{label.ljust(15)} |{gauge}| {score:.3f}", color
-                )
-                y += 1
+            component_scores = [
+                ("Detection", self.insights.format_stats.detection_confidence),
+                ("Parsing", self.insights.parsing_stats.success_rate),
+            ]
 
-    def draw_help_tab(self, start_y, height, width):
-        help_text = [
-            "LOG EXPLORER TUI - SINGLE FILE ANALYSIS",
-            "",
-            "WORKFLOW:",
-            "  1. FILES TAB: Navigate and load a log file",
-            "  2. Process with 'p' to analyze the file",
-            "  3. SEARCH TAB: Query and filter log entries",
-            "  4. STATS TAB: View complete analysis metrics",
-            "  5. PLOTS TAB: Visual representations of data",
-            "",
-            "GLOBAL CONTROLS:",
-            "  Tab              - Switch to next tab",
-            "  q                - Quit application",
-            "  Page Up/Down     - Scroll content",
-            "",
-            "FILES TAB:",
-            "  Up/Down          - Navigate directory",
-            "  Enter            - Enter directory or load file",
-            "  c                - Change directory (input mode)",
-            "  r                - Refresh directory listing",
-            "  p                - Process current file (full analysis)",
-            "",
-            "SEARCH TAB:",
-            "  NAVIGATION MODE:",
-            "    Shift+Tab      - Move between form fields",
-            "    Up/Down        - Move between form fields",
-            "    Enter/Type     - Start editing text fields",
-            "    Space          - Toggle boolean/cycle operator",
-            "    Backspace      - Clear current field",
-            "    Enter          - Execute search (when not editing and no text field highlighted)",
-            "                    !Highlight Operator/Case Sensitive!",
-            "  INPUT MODE:",
-            "    Type           - Edit text",
-            "    Enter          - Save and exit input mode",
-            "    Esc            - Cancel and exit input mode",
-            "    Ctrl+U         - Clear current line",
-            "  RESULTS:",
-            "    v              - Toggle raw lines view",
-            "    Page Up/Down   - Scroll search results",
-            "    F/B            - Scroll field values table",
-            "",
-            "TIME FORMAT:",
-            "  Use: YYYY-MM-DD HH:MM:SS",
-            "  Example: 2024-01-15 14:30:00",
-            "",
-            "SUPPORTED FORMATS:",
-            "  JSON, CSV, LTSV, Key-Value pairs",
-            "  Apache/Nginx access & error logs",
-            "  Syslog, Systemd Journal entries",
-            "  Python logging, Basic log formats",
-            "",
-            "COMPRESSION SUPPORT:",
-            "  .gz (gzip), .bz2 (bzip2), .xz (xz), .lzma (lzma)",
-        ]
+        return rate_rows, hour_bars, component_scores
 
+    def draw_help_tab(self, start_y, height, width):
         scroll_pos = self.scroll_positions["main"]
         y = start_y
-        for line in help_text[scroll_pos:]:
-            if y >= start_y + height - 1:
-                break
-
-            if line.startswith("LOG EXPLORER"):
-                color = curses.A_BOLD | curses.color_pair(6)
-            elif line.endswith(":") and not line.startswith("  "):
-                color = curses.A_UNDERLINE | curses.color_pair(5)
-            elif line.startswith("  ") and " - " in line:
-                parts = line.split(" - ", 1)
-                self.stdscr.addstr(y, 1, parts[0], curses.color_pair(6))
-                if len(parts) > 1:
-                    self.stdscr.addstr(y, len(parts[0]) + 3, parts[1])
-                y += 1
-                continue
-            else:
-                color = 0
-
-            self.stdscr.addstr(y, 1, line, color)
+        visible_rows = max(0, height - 1)
+        for style, text, description in HELP_LINES[
+            scroll_pos : scroll_pos + visible_rows
+        ]:
+            self.stdscr.addstr(y, 1, text, self._help_styles[style])
+            if description is not None:
+                self.stdscr.addstr(y, len(text) + 3, description)
             y += 1
 
     def draw_status_bar(self, y, width):
-        # Clear the line
-        self.stdscr.addstr(y, 0, " " * (width - 1))
+        # The line is already blank: draw() erases the screen first
 
         # Status message
         if self.error_message:
             msg = f"ERROR: {self.error_message}"
-            self.stdscr.addstr(y, 1, msg[: width - 2], curses.color_pair(2))
+            self.stdscr.addstr(y, 1, msg[: width - 2], self.color_error)
             self.error_message = ""  # Clear after showing
         elif self.status_message:
             self.stdscr.addstr(
-                y, 1, self.status_message[: width - 2], curses.color_pair(3)
+                y, 1, self.status_message[: width - 2], self.color_success
             )
         else:
-            # Default status
-            tab_name = self.tabs[self.current_tab]
-            file_status = (
-                f"File: {Path(self.current_file).name}"
-                if self.current_file
-                else "No file"
-            )
-            mode_status = (
-                " [INPUT MODE]"
-                if (self.current_tab == 1 and self.search_form.input_mode)
-                else ""
-            )
-            default_msg = f"{tab_name}{mode_status} | {file_status} | Press 'q' to quit"
-            self.stdscr.addstr(y, 1, default_msg[: width - 2])
+            # Default status, rebuilt only when tab, file or input mode change
+            input_mode = self.current_tab == 1 and self.search_form.input_mode
+            key = (self.current_tab, self.current_file, input_mode)
+            if self._status_cache[0] != key:
+                tab_name = self.tabs[self.current_tab]
+                file_status = (
+                    f"File: {Path(self.current_file).name}"
+                    if self.current_file
+                    else "No file"
+                )
+                mode_status = " [INPUT MODE]" if input_mode else ""
+                default_msg = (
+                    f"{tab_name}{mode_status} | {file_status} | Press 'q' to quit"
+                )
+                self._status_cache = (key, default_msg)
+            self.stdscr.addstr(y, 1, self._status_cache[1][: width - 2])
 
     def handle_input(self, key):
-        # Global keys (always processed first)
-        if key == ord("q"):
-            return False
-        elif key == 27:  # ESC key - handle properly without exiting
-            if self.current_tab == 1 and self.search_form.input_mode:
-                # Let search form handle ESC to exit input mode
-                self.search_form.handle_input(key)
-            # For other cases, just ignore ESC (don't exit the application)
-            return True
-        elif key == ord("\t") or key == 9:  # Tab
-            if self.current_tab == 1:  # Search tab special handling
-                if not self.search_form.input_mode:
-                    self.current_tab = (self.current_tab + 1) % len(self.tabs)
-                    self._reset_scroll_positions()
-                # If in input mode, let search form handle it
-            else:
-                self.current_tab = (self.current_tab + 1) % len(self.tabs)
-                self._reset_scroll_positions()
-        elif key == curses.KEY_BTAB:  # Shift+Tab
-            if self.current_tab == 1:  # Search tab - pass to form
-                handled = self.search_form.handle_input(key)
-                return handled
-            else:
-                self.current_tab = (self.current_tab - 1) % len(self.tabs)
-                self._reset_scroll_positions()
-        elif key == curses.KEY_PPAGE:  # Page Up
-            self._handle_scroll(key)
-        elif key == curses.KEY_NPAGE:  # Page Down
-            self._handle_scroll(key)
-        else:
-            # Tab-specific input handling
-            return self._handle_tab_specific_input(key)
+        # Global keys (always processed first), then the current tab's keys
+        handler = self._global_key_handlers.get(key)
+        if handler is None:
+            handler = self._tab_input_handlers[self.current_tab]
+        return handler(key)
+
+    def _handle_quit_key(self, key):
+        return False
 
+    def _handle_escape_key(self, key):
+        """ESC leaves search input mode and is otherwise ignored"""
+        if self.current_tab == 1 and self.search_form.input_mode:
+            # Let search form handle ESC to exit input mode
+            self._handle_form_input(key)
+        # For other cases, just ignore ESC (don't exit the application)
         return True
 
+    def _handle_tab_key(self, key):
+        # In search input mode, Tab must not leave the form
+        if self.current_tab != 1 or not self.search_form.input_mode:
+            self._switch_tab(1)
+        return True
+
+    def _handle_back_tab_key(self, key):
+        if self.current_tab == 1:  # Search tab - pass to form
+            return self._handle_form_input(key)
+        self._switch_tab(-1)
+        return True
+
+    def _switch_tab(self, step):
+        self.current_tab = (self.current_tab + step) % len(self.tabs)
+        self._reset_scroll_positions()
+        self._dirty = True
+
     def _reset_scroll_positions(self):
         """Reset scroll positions when changing tabs"""
-        for key in self.scroll_positions:
-            self.scroll_positions[key] = 0
+        self.scroll_positions = dict.fromkeys(self.scroll_positions, 0)
 
     def _handle_scroll(self, key):
         """Handle scrolling for different tabs and contexts"""
@@ -1286,15 +1480,6 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
                 self.scroll("main", -10)
             elif key == curses.KEY_NPAGE:
                 self.scroll("main", 10)
-
-    def _handle_tab_specific_input(self, key):
-        """Route input to appropriate tab handler"""
-        if self.current_tab == 0:  # Files
-            return self._handle_files_input(key)
-        elif self.current_tab == 1:  # Search
-            return self._handle_search_input(key)
-        elif self.current_tab in [2, 3, 4]:  # Stats/Plots/Help
-            return self._handle_scroll_only_input(key)
         return True
 
     def _handle_files_input(self, key):
@@ -1305,33 +1490,34 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
             self.scroll("files", 1, len(self.dir_contents))
         elif key in (ord("\n"), ord("\r"), 10):  # Enter
             self._select_file_or_directory()
+            self._dirty = True
         elif key == ord("c"):  # Change directory
             self._prompt_change_directory()
+            self._dirty = True
         elif key == ord("r"):  # Refresh
             self.refresh_dir_contents()
             self.status_message = "Directory refreshed"
+            self._dirty = True
         elif key == ord("p"):  # Process file
             self._process_current_file()
+            self._dirty = True
         return True
 
     def _handle_search_input(self, key):
         """Handle search tab input with proper mode awareness"""
         # If in input mode, let form handle ALL input
         if self.search_form.input_mode:
-            handled = self.search_form.handle_input(key)
+            handled = self._handle_form_input(key)
             return handled
 
         # Navigation mode - handle search-specific keys first
         if key == ord("v"):  # Toggle view (only in navigation mode)
             self.show_raw_lines = not self.show_raw_lines
+            self._dirty = True
             return True
         elif key in (ord("f"), ord("F")):  # Scroll field values forward
             if self.search_results and self.search_results.field_counts:
-                total_pairs = sum(
-                    min(3, len(counts))
-                    for counts in self.search_results.field_counts.values()
-                )
-                self.scroll("field_values", 1, total_pairs)
+                self.scroll("field_values", 1, len(self._field_value_pairs()))
             return True
         elif key in (ord("b"), ord("B")):  # Scroll field values backward
             self.scroll("field_values", -1)
@@ -1341,16 +1527,25 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
             field_key = self.search_form.field_order[self.search_form.current_field]
             if field_key not in self.search_form.text_fields:
                 self._execute_search()
+                self._dirty = True
                 return True
             else:
                 # Let the form handle Enter for text fields
-                handled = self.search_form.handle_input(key)
+                handled = self._handle_form_input(key)
                 return handled
         else:
             # Let form handle other navigation and input
-            handled = self.search_form.handle_input(key)
+            handled = self._handle_form_input(key)
             return handled
 
+    def _handle_form_input(self, key):
+        """Pass a key to the search form, redrawing only if the form changed"""
+        before = self.search_form.snapshot()
+        handled = self.search_form.handle_input(key)
+        if self.search_form.snapshot() != before:
+            self._dirty = True
+        return handled
+
     def _handle_scroll_only_input(self, key):
         """Handle input for tabs that only support scrolling"""
         if key == curses.KEY_UP:
@@ -1416,6 +1611,8 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
 
         curses.noecho()
         curses.curs_set(0)
+        # The terminal may have been resized while getstr was blocking
+        self._recompute_layout()
 
     def _process_current_file(self):
         """Process the current file"""
@@ -1444,6 +1641,8 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
             self.stats_analyzer.add_detection_result(self.detection_result)
             self.stats_analyzer.add_parse_result(self.parse_result)
             self.insights = self.stats_analyzer.analyze()
+            self._stats_cache = (None, None)
+            self._plots_cache = (None, None)
 
             self.status_message = (
                 f"Successfully processed {Path(self.current_file).name}"
@@ -1464,6 +1663,8 @@ class LogExplorerTUI(BaseUI, ScrollableContent):
 
             # Execute search
             self.search_results = self.search_engine.search(query)
+            self._field_names_cache = (None, None)
+            self._field_pairs_cache = (None, None)
             self.scroll_positions["results"] = 0
             self.scroll_positions["field_values"] = 0
 